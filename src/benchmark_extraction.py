@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+import re
+import csv
+import time
+import logging
+from improved_hourly_scraper import extract_text_fields, KeywordMatcher, EMPLOYMENT_TYPES
+
+# The scraper module configures INFO logging into improved_scraper.log on import; replace it
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(message)s', force=True)
+
+# Per-call functions as extract_date_posted, extract_salary, extract_employment_type
+# and analyze_experience_level ran before extract_text_fields
+def legacy_date_posted(text):
+    date_patterns = [
+        r'(\d+\s*days?\s*ago)', r'(\d+\s*hours?\s*ago)', r'(\d+\s*weeks?\s*ago)',
+        r'(yesterday)', r'(today)', r'(just now)', r'(last week)',
+        r'(posted\s+\d+\s*days?\s*ago)', r'(posted\s+yesterday)', r'(posted\s+today)'
+    ]
+    text_lower = text.lower()
+    for pattern in date_patterns:
+        match = re.search(pattern, text_lower)
+        if match:
+            return match.group(1)
+    return ""
+
+def legacy_salary(text):
+    salary_patterns = [
+        r'\$[\d,]+\s*-\s*\$[\d,]+', r'\$[\d,]+k?\s*-\s*\$?[\d,]+k?',
+        r'salary:\s*\$[\d,]+', r'[\d,]+k?\s*-\s*[\d,]+k?\s*(?:per year|annually)'
+    ]
+    for pattern in salary_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return match.group(0)
+    return ""
+
+# extract_employment_type read the shared KeywordMatcher, which matches keywords at word starts
+EMPLOYMENT_MATCHER = KeywordMatcher(EMPLOYMENT_TYPES)
+
+def legacy_employment_type(text):
+    found = EMPLOYMENT_MATCHER.classes(text)
+    for employment_type in EMPLOYMENT_TYPES:
+        if employment_type in found:
+            return employment_type
+    return ""
+
+def legacy_experience_years(text):
+    year_patterns = [
+        r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)', r'minimum\s*(\d+)\s*years?',
+        r'(\d+)\s*to\s*(\d+)\s*years?', r'(\d+)-(\d+)\s*years?'
+    ]
+    found = []
+    for pattern in year_patterns:
+        for match in re.findall(pattern, text.lower()):
+            if isinstance(match, tuple):
+                years = [int(x) for x in match if x.isdigit()]
+                found.append(min(years) if years else 0)
+            else:
+                found.append(int(match))
+    return found
+
+def legacy_extract(text):
+    """All four fields the way the old per-call functions produced them"""
+    return (legacy_date_posted(text), legacy_salary(text),
+            legacy_employment_type(text), legacy_experience_years(text))
+
+def load_texts(path='unsent_jobs_20250620_142020.csv'):
+    """Job texts from a saved export, plus synthetic cards that exercise every field"""
+    texts = []
+    try:
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                texts.append(f"{row['Job Title']}\n{row['Location']}\n{row['Job Description']}")
+    except FileNotFoundError:
+        print(f"⚠️  {path} not found, using synthetic cards only")
+
+    for i in range(200):
+        texts.append(
+            f"Software Engineer {i}\nSeattle, WA · Full-time\nPosted {i % 9} days ago\n"
+            f"$120,000 - $150,000 per year. {i % 6}+ years of experience with Python. "
+            + "We build reliable distributed systems for millions of customers. " * 4
+        )
+        # Cards where pattern priority, not position, decides the result
+        texts.append(
+            f"Backend Engineer {i}\nRemote · Contract, full time after 6 months\nUpdated today · Posted {i % 40} days ago\n"
+            f"{i % 4}-{i % 4 + 2} years of experience required, minimum {i % 3} years with Go. Internal tools."
+        )
+    return texts
+
+def benchmark_extraction(rounds=20):
+    """Compare the old per-call functions against extract_text_fields, speed and results"""
+    texts = load_texts()
+
+    print("🚀 EXTRACTION BENCHMARK")
+    print("="*50)
+    print(f"📄 {len(texts)} job texts, {rounds} rounds")
+
+    start = time.perf_counter()
+    for r in range(rounds):
+        for text in texts:
+            legacy_extract(f"{text} {r}")
+    legacy_us = (time.perf_counter() - start) * 1e6 / (rounds * len(texts))
+
+    # Unique text per round so the result cache never hides the regex cost
+    start = time.perf_counter()
+    for r in range(rounds):
+        for text in texts:
+            extract_text_fields(f"{text} {r}")
+    combined_us = (time.perf_counter() - start) * 1e6 / (rounds * len(texts))
+
+    same_date = sum(legacy_date_posted(t) == extract_text_fields(t)['date_posted'] for t in texts)
+    same_salary = sum(legacy_salary(t) == extract_text_fields(t)['salary'] for t in texts)
+    same_experience = sum(legacy_experience_years(t) == list(extract_text_fields(t)['experience_years'])
+                          for t in texts)
+    same_employment = sum(legacy_employment_type(t) == extract_text_fields(t)['employment_type'] for t in texts)
+
+    print(f"   Per-call functions:     {legacy_us:.1f} µs/text")
+    print(f"   extract_text_fields:    {combined_us:.1f} µs/text")
+    if combined_us > 0:
+        print(f"   ⚡ Speedup: {legacy_us / combined_us:.1f}x")
+    print(f"   ✅ Same date on {same_date}/{len(texts)} texts, same salary on {same_salary}/{len(texts)}")
+    print(f"   ✅ Same experience years on {same_experience}/{len(texts)}, "
+          f"same employment type on {same_employment}/{len(texts)}")
+
+if __name__ == "__main__":
+    benchmark_extraction()
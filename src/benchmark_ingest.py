@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+import sys
+import time
+import logging
+from datetime import datetime
+from improved_hourly_scraper import JobDatabase, JobRecord
+
+# The scraper module configures INFO logging into improved_scraper.log on import; replace it
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(message)s', force=True)
+
+# Benchmark rows live under their own host so they can be deleted afterwards
+URL_PREFIX = 'https://ingest-benchmark.invalid/jobs/'
+
+def build_jobs(count):
+    """Synthetic jobs shaped like real extraction output"""
+    return [
+        JobRecord(
+            company_name=f"Benchmark Company {i % 500}",
+            job_title=f"Software Engineer {i}",
+            job_url=f"{URL_PREFIX}{i}",
+            location='Seattle, WA',
+            experience_required='Entry Level',
+            posted_date=datetime.now(),
+            date_posted=f"{i % 7} days ago",
+            salary='$120,000 - $150,000',
+            employment_type='Full-time',
+            raw_text=f"Software Engineer {i}\nSeattle, WA\n" + "Build reliable services in Python.\t" * 20
+        )
+        for i in range(count)
+    ]
+
+def delete_benchmark_rows(db):
+    with db.pool.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM jobs WHERE job_url LIKE %s", (URL_PREFIX + '%',))
+        conn.commit()
+        cursor.close()
+
+def time_save(save, jobs):
+    """Seconds taken and rows inserted by one save call"""
+    start = time.perf_counter()
+    inserted = save(jobs)
+    return time.perf_counter() - start, inserted
+
+def benchmark_ingest(sizes=(1000, 10000, 100000)):
+    """Compare execute_values INSERTs against COPY + merge for fresh rows and for replays"""
+    db = JobDatabase()
+
+    print("🚀 INGEST BENCHMARK")
+    print("="*50)
+    print(f"⚠️  Writes to the configured database; rows under {URL_PREFIX} are deleted afterwards")
+
+    try:
+        delete_benchmark_rows(db)
+    except Exception as e:
+        print(f"❌ Database not reachable: {e}")
+        return False
+
+    try:
+        for size in sizes:
+            jobs = build_jobs(size)
+            print(f"\n📄 {size:,} jobs")
+
+            for label, save in [('execute_values INSERT', db.bulk_save_jobs), ('COPY + merge', db.copy_save_jobs)]:
+                fresh_seconds, fresh_inserted = time_save(save, jobs)
+                # Same rows again: every one conflicts, as in a replay or backfill overlap
+                replay_seconds, replay_inserted = time_save(save, jobs)
+                delete_benchmark_rows(db)
+
+                print(f"   {label:<22} fresh: {fresh_seconds:6.2f}s ({size / fresh_seconds:,.0f} rows/s, "
+                      f"{fresh_inserted} inserted)   replay: {replay_seconds:6.2f}s ({replay_inserted} inserted)")
+    finally:
+        delete_benchmark_rows(db)
+        db.pool.close()
+
+    return True
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or (1000, 10000, 100000)
+    benchmark_ingest(sizes)
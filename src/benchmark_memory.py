@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+import random
+import logging
+import tracemalloc
+from improved_hourly_scraper import JobPageParser
+
+# The scraper module configures INFO logging into improved_scraper.log on import; replace it
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(message)s', force=True)
+
+def card_text(rng, i):
+    """Job card text; one in ten is a wrapper element holding a whole listing"""
+    sentence = f"Build and operate services for team {i}. Python, Go, AWS. Posted {i % 9} days ago. "
+    repeats = rng.randint(300, 800) if i % 10 == 0 else rng.randint(2, 20)
+    return f"Software Engineer {i}\nSeattle, WA · Full-time\n" + sentence * repeats
+
+def legacy_job_dict(parser, company_name, title, url, raw_text):
+    """The 11-key dict build_job_data returned before JobRecord"""
+    job = parser.build_job_data(company_name, title, url, raw_text)
+    return {
+        'company_name': company_name,
+        'job_title': title,
+        'job_url': url,
+        'location': job.location,
+        'job_description': raw_text[:500],
+        'experience_required': job.experience_required,
+        'posted_date': job.posted_date,
+        'date_posted': job.date_posted,
+        'salary': job.salary,
+        'employment_type': job.employment_type,
+        'raw_text': raw_text
+    }
+
+def simulate_cycle(build, companies=40, jobs_per_company=20, seed=7):
+    """Peak and retained traced memory (MB) while a cycle's all_jobs list fills up"""
+    rng = random.Random(seed)
+    tracemalloc.start()
+    all_jobs = []
+    for c in range(companies):
+        company_name = ''.join(['Company ', str(c)])  # One string per company, as read from the CSV
+        for j in range(jobs_per_company):
+            i = c * jobs_per_company + j
+            all_jobs.append(build(company_name, f"Software Engineer {i}",
+                                  f"https://example.com/jobs/{i}", card_text(rng, i)))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / (1024 * 1024), peak / (1024 * 1024), len(all_jobs)
+
+def benchmark_memory():
+    """Compare cycle memory of per-job dicts against JobRecord"""
+    parser = JobPageParser()
+
+    print("🚀 JOB MEMORY BENCHMARK")
+    print("="*50)
+
+    legacy = simulate_cycle(lambda *job: legacy_job_dict(parser, *job))
+    records = simulate_cycle(lambda *job: parser.build_job_data(*job))
+
+    print(f"📄 {legacy[2]} jobs across one simulated cycle")
+    print(f"   Job dicts:   {legacy[0]:.1f} MB retained, {legacy[1]:.1f} MB peak")
+    print(f"   JobRecords:  {records[0]:.1f} MB retained, {records[1]:.1f} MB peak")
+    if records[1] > 0:
+        print(f"   💾 Peak reduced {legacy[1] / records[1]:.1f}x")
+
+if __name__ == "__main__":
+    benchmark_memory()
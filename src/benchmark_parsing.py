@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+import time
+import logging
+from improved_hourly_scraper import JobPageParser
+
+# The scraper module configures INFO logging into improved_scraper.log on import; replace it
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(message)s', force=True)
+
+def build_career_page(num_jobs=400, filler_blocks=3000):
+    """Build a large synthetic career page with navigation noise"""
+    parts = ['<html><head><title>Careers</title>']
+    parts.append('<script>' + 'var x = 1;' * 2000 + '</script></head><body>')
+    parts.append('<nav><ul>')
+    for i in range(200):
+        parts.append(f'<li class="nav-item"><a href="/section/{i}">Section {i}</a></li>')
+    parts.append('</ul></nav><main>')
+    for i in range(filler_blocks):
+        parts.append(f'<div class="content-block"><p>Paragraph {i} about our culture and values.</p></div>')
+    parts.append('<div class="results">')
+    for i in range(num_jobs):
+        parts.append(
+            f'<div class="position-card"><h3>Software Engineer {i}</h3>'
+            f'<a href="/careers/jobs/{i}">View role</a>'
+            f'<span>San Francisco, CA</span><span>Full-time</span><span>Posted 2 days ago</span></div>'
+        )
+    parts.append('</div></main></body></html>')
+    return ''.join(parts).encode('utf-8')
+
+def time_parser(find_elements, content, rounds):
+    """Return average milliseconds and element count for a find function"""
+    elements = find_elements(content)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        find_elements(content)
+    return (time.perf_counter() - start) * 1000 / rounds, len(elements)
+
+def benchmark_parsing(rounds=10):
+    """Compare html.parser + per-selector select against the lxml single-pass cascade"""
+    parser = JobPageParser()
+
+    print("🚀 PARSING BENCHMARK")
+    print("="*50)
+
+    for num_jobs, filler_blocks in [(20, 200), (200, 1500), (400, 3000)]:
+        content = build_career_page(num_jobs, filler_blocks)
+        soup_ms, soup_count = time_parser(parser.find_job_elements_soup, content, rounds)
+        lxml_ms, lxml_count = time_parser(parser.find_job_elements_lxml, content, rounds)
+
+        print(f"\n📄 Page: {len(content) / 1024:.0f} KB, {num_jobs} job cards")
+        print(f"   BeautifulSoup (html.parser): {soup_ms:.1f} ms/page ({soup_count} elements)")
+        print(f"   lxml single pass:            {lxml_ms:.1f} ms/page ({lxml_count} elements)")
+        if lxml_ms > 0:
+            print(f"   ⚡ Speedup: {soup_ms / lxml_ms:.1f}x")
+
+if __name__ == "__main__":
+    benchmark_parsing()
@@ -3,6 +3,9 @@ from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 import os
 from dotenv import load_dotenv
 import logging
+from db_pool import get_pool
+from job_urls import URL_HASH_SQL, ensure_url_hash_key
+from notification_outbox import ensure_notification_outbox
 
 # Load environment variables
 load_dotenv()
@@ -44,83 +47,98 @@ def create_database():
 def setup_tables():
     """Setup database tables and indexes"""
     try:
-        # Connect to the job_scraper database
-        conn = psycopg2.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            database=os.getenv('DB_NAME', 'job_scraper'),
-            user=os.getenv('DB_USER', 'postgres'),
-            password=os.getenv('DB_PASSWORD', ''),
-            port=os.getenv('DB_PORT', '5432')
-        )
-        cursor = conn.cursor()
-        
-        # Create jobs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                id SERIAL PRIMARY KEY,
-                job_title VARCHAR(500) NOT NULL,
-                company_name VARCHAR(200) NOT NULL,
-                job_url VARCHAR(1000) UNIQUE NOT NULL,
-                job_description TEXT,
-                experience_required VARCHAR(100),
-                location VARCHAR(200),
-                posted_date TIMESTAMP,
-                salary VARCHAR(200),
-                employment_type VARCHAR(100),
-                scraped_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                notification_sent BOOLEAN DEFAULT FALSE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create indexes for better performance
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_jobs_url ON jobs(job_url);
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company_name);
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_jobs_notification ON jobs(notification_sent);
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_jobs_scraped_date ON jobs(scraped_date);
-        """)
-        
-        # Create companies table for tracking scraping statistics
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS companies (
-                id SERIAL PRIMARY KEY,
-                company_name VARCHAR(200) UNIQUE NOT NULL,
-                website_url VARCHAR(1000),
-                last_scraped TIMESTAMP,
-                total_jobs_found INTEGER DEFAULT 0,
-                entry_level_jobs_found INTEGER DEFAULT 0,
-                scraping_enabled BOOLEAN DEFAULT TRUE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create scraping_logs table for monitoring
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS scraping_logs (
-                id SERIAL PRIMARY KEY,
-                company_name VARCHAR(200),
-                scrape_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                jobs_found INTEGER DEFAULT 0,
-                entry_level_found INTEGER DEFAULT 0,
-                status VARCHAR(50),
-                error_message TEXT,
-                duration_seconds INTEGER
-            )
-        """)
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
-        
-        print("Database tables and indexes created successfully")
-        return True
+        # Connect to the job_scraper database through the shared pool
+        with get_pool().connection() as conn:
+            cursor = conn.cursor()
+            
+            # Create jobs table; url_hash of the canonical job URL is the job's identity
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id SERIAL PRIMARY KEY,
+                    job_title VARCHAR(500) NOT NULL,
+                    company_name VARCHAR(200) NOT NULL,
+                    job_url VARCHAR(1000) NOT NULL,
+                    url_hash BIGINT GENERATED ALWAYS AS ({url_hash_sql}) STORED,
+                    job_description TEXT,
+                    experience_required VARCHAR(100),
+                    location VARCHAR(200),
+                    posted_date TIMESTAMP,
+                    salary VARCHAR(200),
+                    employment_type VARCHAR(100),
+                    scraped_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    notification_sent BOOLEAN DEFAULT FALSE,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """.format(url_hash_sql=URL_HASH_SQL))
+            
+            # Tables from before url_hash get their stored URLs canonicalized first
+            migrated = ensure_url_hash_key(cursor)
+            if migrated:
+                print(f"Keyed jobs by url_hash: {migrated[0]} stored URLs canonicalized, "
+                      f"{migrated[1]} duplicates removed")
+            
+            # Create indexes for better performance
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company_name);
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_jobs_scraped_date ON jobs(scraped_date);
+            """)
+            
+            # Create notification outbox, filled with every newly inserted job
+            queued = ensure_notification_outbox(cursor)
+            if queued:
+                print(f"Queued {queued} unsent jobs in the notification outbox")
+            
+            # Create companies table for tracking scraping statistics
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS companies (
+                    id SERIAL PRIMARY KEY,
+                    company_name VARCHAR(200) UNIQUE NOT NULL,
+                    website_url VARCHAR(1000),
+                    last_scraped TIMESTAMP,
+                    total_jobs_found INTEGER DEFAULT 0,
+                    entry_level_jobs_found INTEGER DEFAULT 0,
+                    scraping_enabled BOOLEAN DEFAULT TRUE,
+                    preferred_strategy VARCHAR(20),
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Create scraping_logs table for monitoring
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS scraping_logs (
+                    id SERIAL PRIMARY KEY,
+                    company_name VARCHAR(200),
+                    scrape_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    jobs_found INTEGER DEFAULT 0,
+                    entry_level_found INTEGER DEFAULT 0,
+                    status VARCHAR(50),
+                    error_message TEXT,
+                    duration_seconds REAL,
+                    strategy VARCHAR(20)
+                )
+            """)
+            # Create host_health table for the per-host circuit breaker
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS host_health (
+                    host VARCHAR(255) PRIMARY KEY,
+                    state VARCHAR(20) NOT NULL DEFAULT 'closed',
+                    consecutive_failures INTEGER DEFAULT 0,
+                    retry_at TIMESTAMP,
+                    last_error TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_scraping_logs_company_time ON scraping_logs(company_name, scrape_time);
+            """)
+            
+            conn.commit()
+            cursor.close()
+            
+            print("Database tables and indexes created successfully")
+            return True
         
     except Exception as e:
         print(f"Error setting up tables: {e}")
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Shared PostgreSQL connection pool for the scraper and the command-line tools
+"""
+
+import os
+import time
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from dotenv import load_dotenv
+import psycopg2
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+from psycopg2.pool import ThreadedConnectionPool
+
+# Load environment variables
+load_dotenv()
+
+def connection_params_from_env():
+    """Connection settings from the DB_* environment variables"""
+    return {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'database': os.getenv('DB_NAME', 'job_scraper'),
+        'user': os.getenv('DB_USER', 'postgres'),
+        'password': os.getenv('DB_PASSWORD', ''),
+        'port': os.getenv('DB_PORT', '5432')
+    }
+
+class PoolTimeout(Exception):
+    """No connection became free within the checkout timeout"""
+
+class ConnectionPool:
+    """Thread-safe PostgreSQL connection pool with health checks and wait metrics
+    
+    Wraps psycopg2's ThreadedConnectionPool, which fails as soon as all
+    max_size connections are checked out; a semaphore makes callers wait up
+    to checkout_timeout seconds for one instead. The pool connects on first
+    use, and every connection runs with a server-side statement_timeout.
+    Connections idle for more than health_check_idle seconds are pinged
+    before reuse and replaced if broken. A transaction a caller left open is
+    rolled back when its connection comes back.
+    """
+    
+    def __init__(self, connection_params=None, min_size=1, max_size=4, statement_timeout_ms=30000,
+                 checkout_timeout=30, health_check_idle=60):
+        self.connection_params = dict(connection_params or connection_params_from_env())
+        if statement_timeout_ms:
+            self.connection_params['options'] = f"-c statement_timeout={int(statement_timeout_ms)}"
+        self.min_size = min_size
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.health_check_idle = health_check_idle
+        
+        self._pool = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._returned_at = {}  # id(connection) -> when it went back to the pool
+        self.stats = self.new_stats()
+    
+    @staticmethod
+    def new_stats():
+        return {'checkouts': 0, 'wait_seconds': 0.0, 'max_wait_seconds': 0.0, 'timeouts': 0,
+                'health_check_failures': 0, 'replaced': 0}
+    
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadedConnectionPool(self.min_size, self.max_size, **self.connection_params)
+            return self._pool
+    
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the duration of a with-block"""
+        start = time.monotonic()
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            with self._lock:
+                self.stats['timeouts'] += 1
+            raise PoolTimeout(f"No database connection free after {self.checkout_timeout}s")
+        
+        try:
+            conn = self._checkout()
+            waited = time.monotonic() - start
+            with self._lock:
+                self.stats['checkouts'] += 1
+                self.stats['wait_seconds'] += waited
+                self.stats['max_wait_seconds'] = max(self.stats['max_wait_seconds'], waited)
+            
+            try:
+                yield conn
+            finally:
+                self._checkin(conn)
+        finally:
+            self._slots.release()
+    
+    def _checkout(self):
+        """A healthy connection from the pool, replacing broken ones"""
+        pool = self._get_pool()
+        for _ in range(self.max_size + 1):
+            conn = pool.getconn()
+            if self._healthy(conn):
+                return conn
+            pool.putconn(conn, close=True)
+            with self._lock:
+                self.stats['replaced'] += 1
+        raise psycopg2.OperationalError("No healthy database connection available")
+    
+    def _healthy(self, conn):
+        if conn.closed:
+            return False
+        
+        # Fresh connections and recently used ones skip the round trip
+        returned_at = self._returned_at.pop(id(conn), None)
+        if returned_at is None or time.monotonic() - returned_at < self.health_check_idle:
+            return True
+        
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error as e:
+            logging.warning(f"Discarding broken database connection: {e}")
+            with self._lock:
+                self.stats['health_check_failures'] += 1
+            return False
+    
+    def _checkin(self, conn):
+        broken = bool(conn.closed)
+        if not broken and conn.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                broken = True
+        
+        if not broken:
+            self._returned_at[id(conn)] = time.monotonic()
+        self._get_pool().putconn(conn, close=broken)
+    
+    def log_stats(self):
+        """Log and reset checkout counts and wait times"""
+        with self._lock:
+            stats, self.stats = self.stats, self.new_stats()
+        
+        if stats['checkouts'] or stats['timeouts']:
+            average_ms = stats['wait_seconds'] * 1000 / max(stats['checkouts'], 1)
+            logging.info(f"DB pool: {stats['checkouts']} checkouts, {average_ms:.1f} ms average wait, "
+                         f"{stats['max_wait_seconds'] * 1000:.1f} ms max, {stats['timeouts']} timeouts, "
+                         f"{stats['replaced']} broken connections replaced")
+    
+    def close(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+            self._returned_at.clear()
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+def get_pool():
+    """The process-wide pool, sized by DB_POOL_MIN, DB_POOL_MAX and DB_STATEMENT_TIMEOUT_MS"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = ConnectionPool(
+                min_size=int(os.getenv('DB_POOL_MIN', '1')),
+                max_size=int(os.getenv('DB_POOL_MAX', '4')),
+                statement_timeout_ms=int(os.getenv('DB_STATEMENT_TIMEOUT_MS', '30000'))
+            )
+            atexit.register(_shared_pool.close)
+        return _shared_pool
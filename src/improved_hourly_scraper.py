@@ -1,21 +1,38 @@
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+import aiohttp
+import asyncio
 from bs4 import BeautifulSoup
+import lxml.html
+import lxml.etree
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from webdriver_manager.chrome import ChromeDriverManager
-import psycopg2
+import psutil
 from psycopg2.extras import execute_values
+from db_pool import get_pool
+from job_urls import canonicalize_url, url_hash, ensure_url_hash_key, URL_HASH_SQL
+from notification_outbox import ensure_notification_outbox
 import re
+import sys
 import time
 import logging
+import threading
+import queue
+import atexit
+import hashlib
+import json
+import io
 from datetime import datetime, timedelta
 import os
 from dotenv import load_dotenv
-from urllib.parse import urljoin, urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 import schedule
 import smtplib
 from email.mime.text import MIMEText
@@ -37,161 +54,751 @@ logging.basicConfig(
     ]
 )
 
+# Employment type keywords, in priority order
+EMPLOYMENT_TYPES = {
+    'Full-time': ['full-time', 'full time'],
+    'Part-time': ['part-time', 'part time'],
+    'Contract': ['contract', 'contractor'],
+    'Internship': ['internship', 'intern'],
+    'Temporary': ['temporary'],
+    'Remote': ['remote']
+}
+EMPLOYMENT_LABELS = {keyword: label for label, keywords in EMPLOYMENT_TYPES.items() for keyword in keywords}
+
+# Compiled once at import; within a field the patterns are tried in priority order
+DATE_PATTERNS = tuple(re.compile(pattern) for pattern in [
+    r'\d+\s*days?\s*ago', r'\d+\s*hours?\s*ago', r'\d+\s*weeks?\s*ago',
+    r'yesterday', r'today', r'just now', r'last week'
+])
+SALARY_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'\$[\d,]+\s*-\s*\$[\d,]+', r'\$[\d,]+k?\s*-\s*\$?[\d,]+k?',
+    r'salary:\s*\$[\d,]+', r'[\d,]+k?\s*-\s*[\d,]+k?\s*(?:per year|annually)'
+])
+# 'N years of experience' comes first, so '3-5 years of experience' reads as 5, not 3
+EXPERIENCE_PATTERNS = tuple(re.compile(pattern) for pattern in [
+    r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)', r'minimum\s*(\d+)\s*years?',
+    r'(\d+)\s*to\s*(\d+)\s*years?', r'(\d+)-(\d+)\s*years?'
+])
+# Starts with plain literals so the regex engine can skip ahead; word starts are checked per hit
+EMPLOYMENT_PATTERN = re.compile('|'.join(
+    re.escape(keyword) for keyword in sorted(EMPLOYMENT_LABELS, key=len, reverse=True)
+))
+RELATIVE_DATE_PATTERN = re.compile(r'(\d+)\s*(day|hour|week)s?\s*ago')
+
+# Longer texts (whole wrapper elements can run to megabytes) are never cached, so they cannot pin memory
+CACHED_TEXT_LIMIT = 4000
+
+def short_text_cache(maxsize):
+    """lru_cache for a function of one text that bypasses the cache for texts over CACHED_TEXT_LIMIT"""
+    def decorator(function):
+        cached = lru_cache(maxsize=maxsize)(function)
+        
+        @wraps(function)
+        def wrapper(text):
+            return cached(text) if len(text) <= CACHED_TEXT_LIMIT else function(text)
+        return wrapper
+    return decorator
+
+def first_match(patterns, text):
+    """Text of the first pattern that matches anywhere in text, or ''"""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(0)
+    return ""
+
+@short_text_cache(maxsize=2048)
+def extract_text_fields(text):
+    """Extract date posted, salary, experience years and employment type in one pass; cached results are shared, do not modify them"""
+    text_lower = text.lower()
+    date_posted = salary = employment_type = ""
+    experience_years = []
+    
+    if 'ago' in text_lower or 'day' in text_lower or 'now' in text_lower or 'week' in text_lower:
+        date_posted = first_match(DATE_PATTERNS, text_lower)
+    
+    if '$' in text_lower or 'per year' in text_lower or 'annually' in text_lower:
+        salary = first_match(SALARY_PATTERNS, text)
+    
+    if 'year' in text_lower:
+        for pattern in EXPERIENCE_PATTERNS:
+            for match in pattern.finditer(text_lower):
+                experience_years.append(min(int(years) for years in match.groups()))
+    
+    found = set()
+    for match in EMPLOYMENT_PATTERN.finditer(text_lower):
+        start = match.start()
+        if not (start and text_lower[start - 1].isalnum()):
+            found.add(EMPLOYMENT_LABELS[match.group(0)])
+    for label in EMPLOYMENT_TYPES:
+        if label in found:
+            employment_type = label
+            break
+    
+    return {
+        'date_posted': date_posted,
+        'salary': salary,
+        'experience_years': tuple(experience_years),
+        'employment_type': employment_type
+    }
+
+class JobRecord:
+    """One job, kept compact with __slots__, a derived description, capped raw_text and interned repeats"""
+    
+    __slots__ = ('company_name', 'job_title', 'job_url', 'location', 'experience_required',
+                 'posted_date', 'date_posted', 'salary', 'employment_type', 'raw_text')
+    FIELDS = frozenset(__slots__) | {'job_description'}
+    RAW_TEXT_LIMIT = 4000
+    DESCRIPTION_LIMIT = 500
+    
+    def __init__(self, company_name, job_title, job_url, location='', experience_required='',
+                 posted_date=None, date_posted='', salary='', employment_type='', raw_text=''):
+        self.company_name = self.intern(company_name)
+        self.job_title = job_title
+        self.job_url = job_url
+        self.location = location
+        self.experience_required = self.intern(experience_required)
+        self.posted_date = posted_date
+        self.date_posted = self.intern(date_posted)
+        self.salary = salary
+        self.employment_type = self.intern(employment_type)
+        self.raw_text = raw_text[:self.RAW_TEXT_LIMIT] if raw_text else raw_text
+    
+    @staticmethod
+    def intern(value):
+        """Share one copy of a repeated string; None and non-strings pass through"""
+        return sys.intern(value) if isinstance(value, str) else value
+    
+    @property
+    def job_description(self):
+        """First DESCRIPTION_LIMIT characters of raw_text, as stored in the jobs table"""
+        return self.raw_text[:self.DESCRIPTION_LIMIT] if self.raw_text else self.raw_text
+    
+    def get(self, field, default=None):
+        """Dict-style field access"""
+        return getattr(self, field) if field in self.FIELDS else default
+    
+    def __getitem__(self, field):
+        if field not in self.FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+    
+    def to_dict(self):
+        """All fields, including the derived description, as a plain dict"""
+        return {field: getattr(self, field) for field in self.__slots__ + ('job_description',)}
+    
+    def __repr__(self):
+        return f"JobRecord({self.company_name!r}, {self.job_title!r}, {self.job_url!r})"
+
 class JobDatabase:
-    def __init__(self):
-        self.connection_params = {
-            'host': os.getenv('DB_HOST', 'localhost'),
-            'database': os.getenv('DB_NAME', 'job_scraper'),
-            'user': os.getenv('DB_USER', 'postgres'),
-            'password': os.getenv('DB_PASSWORD', ''),
-            'port': os.getenv('DB_PORT', '5432')
-        }
+    JOB_COLUMNS = ('job_title', 'company_name', 'job_url', 'job_description', 'experience_required', 'location',
+                   'posted_date', 'salary', 'employment_type', 'date_posted', 'raw_text')
+    
+    def __init__(self, pool=None):
+        # Connections are shared across threads and cycles instead of opened per call
+        self.pool = pool or get_pool()
         self.setup_database()
     
     def setup_database(self):
         """Setup database and tables"""
         try:
-            conn = psycopg2.connect(**self.connection_params)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS jobs (
-                    id SERIAL PRIMARY KEY,
-                    job_title VARCHAR(500) NOT NULL,
-                    company_name VARCHAR(200) NOT NULL,
-                    job_url VARCHAR(1000) UNIQUE NOT NULL,
-                    job_description TEXT,
-                    experience_required VARCHAR(100),
-                    location VARCHAR(200),
-                    posted_date TIMESTAMP,
-                    salary VARCHAR(200),
-                    employment_type VARCHAR(100),
-                    scraped_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    notification_sent BOOLEAN DEFAULT FALSE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    date_posted VARCHAR(100),
-                    raw_text TEXT
-                )
-            """)
-            
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_jobs_url ON jobs(job_url);
-                CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company_name);
-                CREATE INDEX IF NOT EXISTS idx_jobs_notification ON jobs(notification_sent);
-                CREATE INDEX IF NOT EXISTS idx_jobs_scraped_date ON jobs(scraped_date);
-                CREATE INDEX IF NOT EXISTS idx_jobs_posted_date ON jobs(posted_date);
-            """)
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
-            
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS jobs (
+                        id SERIAL PRIMARY KEY,
+                        job_title VARCHAR(500) NOT NULL,
+                        company_name VARCHAR(200) NOT NULL,
+                        job_url VARCHAR(1000) NOT NULL,
+                        job_description TEXT,
+                        experience_required VARCHAR(100),
+                        location VARCHAR(200),
+                        posted_date TIMESTAMP,
+                        salary VARCHAR(200),
+                        employment_type VARCHAR(100),
+                        scraped_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        notification_sent BOOLEAN DEFAULT FALSE,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        date_posted VARCHAR(100),
+                        raw_text TEXT
+                    )
+                """)
+                
+                # Jobs are identified by a fixed-width hash of the canonical URL instead of the URL text
+                migrated = ensure_url_hash_key(cursor)
+                if migrated:
+                    logging.info(f"Keyed jobs by url_hash: {migrated[0]} stored URLs canonicalized, "
+                                 f"{migrated[1]} duplicates removed")
+                
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company_name);
+                    CREATE INDEX IF NOT EXISTS idx_jobs_scraped_date ON jobs(scraped_date);
+                    CREATE INDEX IF NOT EXISTS idx_jobs_posted_date ON jobs(posted_date);
+                """)
+                
+                # Unsent jobs live in a small outbox filled by a trigger, so finding them
+                # costs as much as the backlog instead of a scan over every job
+                queued = ensure_notification_outbox(cursor)
+                if queued:
+                    logging.info(f"Created notification outbox with {queued} unsent jobs")
+                
+                # Per-company scrape history used to pick the cheapest working strategy
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS companies (
+                        id SERIAL PRIMARY KEY,
+                        company_name VARCHAR(200) UNIQUE NOT NULL,
+                        website_url VARCHAR(1000),
+                        last_scraped TIMESTAMP,
+                        total_jobs_found INTEGER DEFAULT 0,
+                        entry_level_jobs_found INTEGER DEFAULT 0,
+                        scraping_enabled BOOLEAN DEFAULT TRUE,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    );
+                    
+                    CREATE TABLE IF NOT EXISTS scraping_logs (
+                        id SERIAL PRIMARY KEY,
+                        company_name VARCHAR(200),
+                        scrape_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        jobs_found INTEGER DEFAULT 0,
+                        entry_level_found INTEGER DEFAULT 0,
+                        status VARCHAR(50),
+                        error_message TEXT,
+                        duration_seconds REAL
+                    );
+                    
+                    CREATE TABLE IF NOT EXISTS host_health (
+                        host VARCHAR(255) PRIMARY KEY,
+                        state VARCHAR(20) NOT NULL DEFAULT 'closed',
+                        consecutive_failures INTEGER DEFAULT 0,
+                        retry_at TIMESTAMP,
+                        last_error TEXT,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    );
+                    
+                    ALTER TABLE companies ADD COLUMN IF NOT EXISTS preferred_strategy VARCHAR(20);
+                    ALTER TABLE scraping_logs ADD COLUMN IF NOT EXISTS strategy VARCHAR(20);
+                    CREATE INDEX IF NOT EXISTS idx_scraping_logs_company_time ON scraping_logs(company_name, scrape_time);
+                """)
+                
+                # COPY target for large batches; rows only live inside the loading transaction
+                cursor.execute("""
+                    CREATE UNLOGGED TABLE IF NOT EXISTS jobs_staging (
+                        job_title VARCHAR(500),
+                        company_name VARCHAR(200),
+                        job_url VARCHAR(1000),
+                        job_description TEXT,
+                        experience_required VARCHAR(100),
+                        location VARCHAR(200),
+                        posted_date TIMESTAMP,
+                        salary VARCHAR(200),
+                        employment_type VARCHAR(100),
+                        date_posted VARCHAR(100),
+                        raw_text TEXT
+                    )
+                """)
+                cursor.execute(f"""
+                    ALTER TABLE jobs_staging ADD COLUMN IF NOT EXISTS url_hash BIGINT
+                        GENERATED ALWAYS AS ({URL_HASH_SQL}) STORED
+                """)
+                
+                conn.commit()
+                cursor.close()
+                
         except Exception as e:
             logging.error(f"Database setup error: {e}")
     
+    @staticmethod
+    def job_values(job):
+        """Row tuple for a job in JOB_COLUMNS order, cut to the column sizes, with missing text as ''"""
+        return (
+            (job.get('job_title') or '')[:500],
+            (job.get('company_name') or '')[:200],
+            (job.get('job_url') or '')[:1000],
+            job.get('job_description') or '',
+            (job.get('experience_required') or '')[:100],
+            (job.get('location') or '')[:200],
+            job.get('posted_date'),
+            (job.get('salary') or '')[:200],
+            (job.get('employment_type') or '')[:100],
+            (job.get('date_posted') or '')[:100],
+            job.get('raw_text') or ''
+        )
+    
+    @staticmethod
+    def copy_field(value):
+        """One field in COPY text format"""
+        if value is None:
+            return '\\N'
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
+    
     def bulk_save_jobs(self, jobs_list):
-        """Save jobs in bulk with conflict handling"""
+        """Save jobs in bulk with conflict handling; returns the number inserted, or None on error"""
         if not jobs_list:
             return 0
         
         try:
-            conn = psycopg2.connect(**self.connection_params)
-            cursor = conn.cursor()
-            
-            insert_query = """
-                INSERT INTO jobs (job_title, company_name, job_url, job_description, 
-                                experience_required, location, posted_date, salary, employment_type,
-                                date_posted, raw_text)
-                VALUES %s
-                ON CONFLICT (job_url) DO NOTHING
-                RETURNING id
-            """
-            
-            values = []
-            for job in jobs_list:
-                values.append((
-                    job.get('job_title', '')[:500],
-                    job.get('company_name', '')[:200],
-                    job.get('job_url', '')[:1000],
-                    job.get('job_description', ''),
-                    job.get('experience_required', '')[:100],
-                    job.get('location', '')[:200],
-                    job.get('posted_date'),
-                    job.get('salary', '')[:200],
-                    job.get('employment_type', '')[:100],
-                    job.get('date_posted', '')[:100],
-                    job.get('raw_text', '')
-                ))
-            
-            execute_values(cursor, insert_query, values)
-            saved_count = cursor.rowcount
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
-            
-            return saved_count
-            
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                insert_query = f"""
+                    INSERT INTO jobs ({', '.join(self.JOB_COLUMNS)})
+                    VALUES %s
+                    ON CONFLICT (url_hash) DO NOTHING
+                    RETURNING id
+                """
+                
+                values = [self.job_values(job) for job in jobs_list]
+                
+                # fetch=True gathers RETURNING rows from every page, not just the last one
+                inserted = execute_values(cursor, insert_query, values, page_size=1000, fetch=True)
+                saved_count = len(inserted)
+                
+                conn.commit()
+                cursor.close()
+                
+                return saved_count
+                
         except Exception as e:
             logging.error(f"Error saving jobs: {e}")
-            return 0
+            return None
     
-    def get_unsent_jobs(self, limit=50):
-        """Get jobs that haven't been notified about yet"""
+    def copy_save_jobs(self, jobs_list):
+        """Save a large batch with COPY and one set-based merge; returns the number inserted, or None on error
+        
+        Rows are streamed into the unlogged jobs_staging table, merged into
+        jobs in a single INSERT ... SELECT and deleted again before commit,
+        so concurrent loaders never see each other's rows.
+        """
+        if not jobs_list:
+            return 0
+        
+        columns = ', '.join(self.JOB_COLUMNS)
+        
         try:
-            conn = psycopg2.connect(**self.connection_params)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT job_title, company_name, job_url, location, experience_required, date_posted
-                FROM jobs 
-                WHERE notification_sent = FALSE 
-                ORDER BY created_at DESC
-                LIMIT %s
-            """, (limit,))
-            
-            jobs = cursor.fetchall()
-            cursor.close()
-            conn.close()
-            
-            return [
-                {
-                    'job_title': job[0],
-                    'company_name': job[1],
-                    'job_url': job[2],
-                    'location': job[3],
-                    'experience_required': job[4],
-                    'date_posted': job[5]
-                }
-                for job in jobs
-            ]
+            buffer = io.StringIO()
+            for job in jobs_list:
+                buffer.write('\t'.join(self.copy_field(value) for value in self.job_values(job)))
+                buffer.write('\n')
+            buffer.seek(0)
             
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.copy_expert(f"COPY jobs_staging ({columns}) FROM STDIN", buffer)
+                
+                # DISTINCT ON keeps one row per URL, the first in batch order
+                cursor.execute(f"""
+                    INSERT INTO jobs ({columns})
+                    SELECT DISTINCT ON (s.url_hash) {', '.join('s.' + column for column in self.JOB_COLUMNS)}
+                    FROM jobs_staging s
+                    WHERE NOT EXISTS (SELECT 1 FROM jobs j WHERE j.url_hash = s.url_hash)
+                    ORDER BY s.url_hash, s.ctid
+                    ON CONFLICT (url_hash) DO NOTHING
+                    RETURNING id
+                """)
+                saved_count = cursor.rowcount
+                
+                cursor.execute("DELETE FROM jobs_staging")
+                
+                conn.commit()
+                cursor.close()
+                
+                return saved_count
+                
+        except Exception as e:
+            logging.error(f"Error copying jobs: {e}")
+            return None
+    
+    def load_job_url_hashes(self):
+        """url_hash of every stored job, streamed with a server-side cursor; None on error"""
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor(name='job_url_hashes')
+                cursor.itersize = 50000
+                cursor.execute("SELECT url_hash FROM jobs")
+                
+                hashes = {row[0] for row in cursor}
+                cursor.close()
+                
+                return hashes
+                
+        except Exception as e:
+            logging.error(f"Error loading job URLs: {e}")
+            return None
+    
+    def get_unsent_jobs(self, limit=50, lease_minutes=15):
+        """Claim up to ``limit`` of the newest unsent jobs from the outbox
+        
+        Claimed jobs are hidden from other senders for ``lease_minutes``;
+        mark_jobs_notified removes them, otherwise they come back once the
+        lease runs out. SKIP LOCKED lets concurrent senders claim disjoint jobs.
+        """
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    WITH claimed AS (
+                        UPDATE notification_outbox
+                        SET claimed_until = NOW() + make_interval(mins => %s)
+                        WHERE job_id IN (
+                            SELECT job_id FROM notification_outbox
+                            WHERE claimed_until IS NULL OR claimed_until < NOW()
+                            ORDER BY created_at DESC
+                            LIMIT %s
+                            FOR UPDATE SKIP LOCKED
+                        )
+                        RETURNING job_id, created_at
+                    )
+                    SELECT j.job_title, j.company_name, j.job_url, j.location, j.experience_required, j.date_posted
+                    FROM claimed c
+                    JOIN jobs j ON j.id = c.job_id
+                    ORDER BY c.created_at DESC
+                """, (lease_minutes, limit))
+                
+                jobs = cursor.fetchall()
+                conn.commit()
+                cursor.close()
+                
+                return [
+                    JobRecord(
+                        job_title=job[0],
+                        company_name=job[1],
+                        job_url=job[2],
+                        location=job[3],
+                        experience_required=job[4],
+                        date_posted=job[5]
+                    )
+                    for job in jobs
+                ]
+                
         except Exception as e:
             logging.error(f"Error getting unsent jobs: {e}")
             return []
     
     def mark_jobs_notified(self, job_urls):
-        """Mark jobs as notified"""
+        """Drop delivered jobs from the outbox and flag them as notified"""
         if not job_urls:
             return
         
         try:
-            conn = psycopg2.connect(**self.connection_params)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                UPDATE jobs 
-                SET notification_sent = TRUE 
-                WHERE job_url = ANY(%s)
-            """, (job_urls,))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
-            
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    WITH delivered AS (
+                        DELETE FROM notification_outbox o
+                        USING jobs j
+                        WHERE o.job_id = j.id AND j.url_hash = ANY(%s::bigint[])
+                        RETURNING o.job_id
+                    )
+                    UPDATE jobs 
+                    SET notification_sent = TRUE 
+                    WHERE id IN (SELECT job_id FROM delivered)
+                """, ([url_hash(url) for url in job_urls],))
+                
+                conn.commit()
+                cursor.close()
+                
         except Exception as e:
             logging.error(f"Error marking jobs as notified: {e}")
 
+    def log_scrape_attempts(self, attempts):
+        """Record one scraping_logs row per strategy attempt and roll totals into companies"""
+        if not attempts:
+            return
+        
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                execute_values(cursor, """
+                    INSERT INTO scraping_logs (company_name, strategy, jobs_found, entry_level_found,
+                                               status, error_message, duration_seconds)
+                    VALUES %s
+                """, [
+                    (
+                        attempt['company_name'][:200],
+                        attempt['strategy'],
+                        attempt['jobs_found'],
+                        attempt['entry_level_found'],
+                        attempt['status'],
+                        attempt.get('error_message'),
+                        attempt['duration_seconds']
+                    )
+                    for attempt in attempts
+                ])
+                
+                # Last attempt per company decides its preferred strategy
+                companies = {}
+                for attempt in attempts:
+                    company = companies.setdefault(attempt['company_name'], {
+                        'website_url': attempt.get('website_url', ''), 'jobs': 0, 'entry_level': 0
+                    })
+                    company['jobs'] += attempt['jobs_found']
+                    company['entry_level'] += attempt['entry_level_found']
+                    company['strategy'] = attempt['strategy']
+                
+                execute_values(cursor, """
+                    INSERT INTO companies (company_name, website_url, last_scraped, total_jobs_found,
+                                           entry_level_jobs_found, preferred_strategy)
+                    VALUES %s
+                    ON CONFLICT (company_name) DO UPDATE SET
+                        website_url = EXCLUDED.website_url,
+                        last_scraped = EXCLUDED.last_scraped,
+                        total_jobs_found = companies.total_jobs_found + EXCLUDED.total_jobs_found,
+                        entry_level_jobs_found = companies.entry_level_jobs_found + EXCLUDED.entry_level_jobs_found,
+                        preferred_strategy = EXCLUDED.preferred_strategy
+                """, [
+                    (name[:200], company['website_url'][:1000], datetime.now(), company['jobs'],
+                     company['entry_level'], company['strategy'])
+                    for name, company in companies.items()
+                ])
+                
+                conn.commit()
+                cursor.close()
+                
+        except Exception as e:
+            logging.error(f"Error logging scrape attempts: {e}")
+    
+    def get_strategy_history(self, days=7):
+        """Per company and strategy: attempts, jobs found, latency and last attempt over the last N days"""
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT company_name, strategy, COUNT(*), SUM(jobs_found),
+                           AVG(duration_seconds), MAX(scrape_time)
+                    FROM scraping_logs
+                    WHERE scrape_time >= NOW() - make_interval(days => %s)
+                      AND strategy IS NOT NULL
+                      AND status NOT IN ('unchanged', 'circuit_open', 'error')
+                    GROUP BY company_name, strategy
+                """, (days,))
+                
+                rows = cursor.fetchall()
+                cursor.close()
+                
+                history = {}
+                for company_name, strategy, attempts, jobs_found, avg_seconds, last_attempt in rows:
+                    history.setdefault(company_name, {})[strategy] = {
+                        'attempts': attempts,
+                        'jobs_found': jobs_found or 0,
+                        'avg_seconds': avg_seconds or 0.0,
+                        'last_attempt': last_attempt
+                    }
+                return history
+                
+        except Exception as e:
+            logging.error(f"Error loading strategy history: {e}")
+            return {}
+
+    def load_host_health(self):
+        """Load the per-host circuit breaker state saved by earlier runs"""
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT host, state, consecutive_failures, retry_at, last_error
+                    FROM host_health
+                """)
+                
+                rows = cursor.fetchall()
+                cursor.close()
+                
+                return {
+                    row[0]: {'state': row[1], 'failures': row[2], 'retry_at': row[3], 'last_error': row[4]}
+                    for row in rows
+                }
+                
+        except Exception as e:
+            logging.error(f"Error loading host health: {e}")
+            return {}
+    
+    def save_host_health(self, hosts):
+        """Upsert per-host circuit breaker state so it survives restarts"""
+        if not hosts:
+            return
+        
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                
+                execute_values(cursor, """
+                    INSERT INTO host_health (host, state, consecutive_failures, retry_at, last_error, updated_at)
+                    VALUES %s
+                    ON CONFLICT (host) DO UPDATE SET
+                        state = EXCLUDED.state,
+                        consecutive_failures = EXCLUDED.consecutive_failures,
+                        retry_at = EXCLUDED.retry_at,
+                        last_error = EXCLUDED.last_error,
+                        updated_at = EXCLUDED.updated_at
+                """, [
+                    (host[:255], entry['state'], entry['failures'], entry['retry_at'], entry['last_error'], datetime.now())
+                    for host, entry in hosts.items()
+                ])
+                
+                conn.commit()
+                cursor.close()
+                
+        except Exception as e:
+            logging.error(f"Error saving host health: {e}")
+
+class JobWriter:
+    """Background writer that saves queued jobs in micro-batches while the cycle is still scraping"""
+    
+    _FLUSH = object()
+    
+    def __init__(self, db, batch_size=100, flush_seconds=2.0, max_queue=1000, max_retries=3, retry_backoff=1.0,
+                 max_batch_size=5000, copy_min_rows=1000, known_urls=None):
+        self.db = db
+        self.known_urls = known_urls  # KnownUrlIndex told about every stored URL
+        self.batch_size = batch_size
+        self.max_batch_size = max(max_batch_size, batch_size)
+        self.copy_min_rows = copy_min_rows  # 0 disables the COPY path
+        self.flush_seconds = flush_seconds
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self.stats = self.new_stats()
+        self.failed_companies = set()  # Companies with jobs in a batch that was given up on
+        
+        self._thread = threading.Thread(target=self._run, name='job-writer', daemon=True)
+        self._thread.start()
+    
+    @staticmethod
+    def new_stats():
+        return {'submitted': 0, 'inserted': 0, 'batches': 0, 'copy_batches': 0, 'retries': 0, 'failed': 0,
+                'blocked_seconds': 0.0, 'max_latency': 0.0}
+    
+    def submit(self, jobs):
+        """Queue jobs for saving, waiting for room while the queue is full"""
+        start = time.monotonic()
+        for job in jobs:
+            self._queue.put((job, time.monotonic()))
+        blocked = time.monotonic() - start
+        
+        with self._lock:
+            self.stats['submitted'] += len(jobs)
+            self.stats['blocked_seconds'] += blocked
+    
+    def flush(self):
+        """Block until every submitted job has been written or given up on"""
+        self._queue.put((self._FLUSH, None))
+        self._queue.join()
+    
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                job, queued_at = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                job = None
+            
+            if job is not None and job is not self._FLUSH:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_seconds
+                batch.append((job, queued_at))
+                
+                # Catch up on a backlog with one bigger batch instead of many small ones
+                while len(batch) >= self.batch_size and len(batch) < self.max_batch_size:
+                    try:
+                        job, queued_at = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is self._FLUSH:
+                        break
+                    batch.append((job, queued_at))
+            
+            if batch and (job is None or job is self._FLUSH or len(batch) >= self.batch_size):
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    logging.error(f"Job writer: batch of {len(batch)} jobs failed ({e}), saving them one at a time")
+                    self._write_each(batch)
+                finally:
+                    # flush() and a full queue wait on these, so they must happen whatever the write did
+                    for _ in batch:
+                        self._queue.task_done()
+                batch = []
+                deadline = None
+            
+            if job is self._FLUSH:
+                self._queue.task_done()
+    
+    def _write(self, batch):
+        jobs = [job for job, _ in batch]
+        use_copy = self.copy_min_rows and len(jobs) >= self.copy_min_rows
+        save = self.db.copy_save_jobs if use_copy else self.db.bulk_save_jobs
+        for attempt in range(self.max_retries + 1):
+            inserted = save(jobs)
+            if inserted is not None:
+                latency = time.monotonic() - min(queued_at for _, queued_at in batch)
+                with self._lock:
+                    self.stats['inserted'] += inserted
+                    self.stats['batches'] += 1
+                    self.stats['copy_batches'] += bool(use_copy)
+                    self.stats['max_latency'] = max(self.stats['max_latency'], latency)
+                # Conflicting rows were already stored, so every URL in the batch is known now
+                if self.known_urls is not None:
+                    self.known_urls.add_many(job['job_url'] for job in jobs)
+                return
+            
+            if attempt < self.max_retries:
+                with self._lock:
+                    self.stats['retries'] += 1
+                time.sleep(self.retry_backoff * 2 ** attempt)
+        
+        logging.error(f"Job writer: giving up on a batch of {len(jobs)} jobs after {self.max_retries} retries")
+        with self._lock:
+            self.stats['failed'] += len(jobs)
+            self.failed_companies.update(job['company_name'] for job in jobs)
+    
+    def _write_each(self, batch):
+        """Save a batch row by row, so one bad job cannot lose the others"""
+        for job, _ in batch:
+            try:
+                inserted = self.db.bulk_save_jobs([job])
+            except Exception as e:
+                logging.error(f"Job writer: could not save {job.get('job_url')}: {e}")
+                inserted = None
+            
+            with self._lock:
+                if inserted is None:
+                    self.stats['failed'] += 1
+                    self.failed_companies.add(job.get('company_name'))
+                else:
+                    self.stats['inserted'] += inserted
+            if inserted is not None and self.known_urls is not None:
+                self.known_urls.add_many([job['job_url']])
+    
+    def take_failed_companies(self):
+        """Companies whose jobs were not all saved since the last call"""
+        with self._lock:
+            failed, self.failed_companies = self.failed_companies, set()
+        return failed
+    
+    def log_stats(self):
+        """Log and reset this cycle's write counts"""
+        with self._lock:
+            stats, self.stats = self.stats, self.new_stats()
+        
+        logging.info(f"Job writer: {stats['submitted']} jobs in {stats['batches']} batches "
+                     f"({stats['copy_batches']} via COPY), "
+                     f"{stats['inserted']} inserted, {stats['retries']} retries, {stats['failed']} failed, "
+                     f"max queue-to-DB latency {stats['max_latency']:.1f}s, "
+                     f"scrapers blocked {stats['blocked_seconds']:.1f}s on a full queue")
+
 class NotificationManager:
     def __init__(self):
         self.email_config = {
@@ -361,23 +968,11 @@ class DateParser:
         if 'yesterday' in date_text:
             return now - timedelta(days=1)
         
-        # Handle "X days ago"
-        day_match = re.search(r'(\d+)\s*days?\s*ago', date_text)
-        if day_match:
-            days = int(day_match.group(1))
-            return now - timedelta(days=days)
-        
-        # Handle "X hours ago"
-        hour_match = re.search(r'(\d+)\s*hours?\s*ago', date_text)
-        if hour_match:
-            hours = int(hour_match.group(1))
-            return now - timedelta(hours=hours)
-        
-        # Handle "X weeks ago"
-        week_match = re.search(r'(\d+)\s*weeks?\s*ago', date_text)
-        if week_match:
-            weeks = int(week_match.group(1))
-            return now - timedelta(weeks=weeks)
+        # Handle "X days/hours/weeks ago"
+        relative_match = RELATIVE_DATE_PATTERN.search(date_text)
+        if relative_match:
+            count = int(relative_match.group(1))
+            return now - timedelta(**{relative_match.group(2) + 's': count})
         
         # Handle "last week"
         if 'last week' in date_text:
@@ -398,208 +993,1334 @@ class DateParser:
         days_old = (datetime.now() - parsed_date).days
         return days_old <= max_days
 
-class ImprovedJobScraper:
-    """Improved job scraper with better detection and time filtering"""
+class KeywordMatcher:
+    """Find every keyword class in a text with one precompiled regex
     
-    def __init__(self, max_jobs_per_company=15, max_workers=8, timeout=8, max_days_old=7):
-        self.max_jobs_per_company = max_jobs_per_company
-        self.max_workers = max_workers
-        self.timeout = timeout
-        self.max_days_old = max_days_old  # Only scrape jobs from last N days
+    Keywords only match at the start of a word, so 'us' no longer hits
+    'business'. Short keywords (last word of three characters or fewer, like
+    'it', 'ca' or 'sde i') must also end at a word boundary. A hit on a longer
+    keyword also counts for the keywords it contains ('engineer i' implies
+    'engineer'), since the regex never reports overlapping matches.
+    """
+    
+    def __init__(self, keyword_classes, cache_size=2048):
+        own_classes = {}
+        for keyword_class, keywords in keyword_classes.items():
+            for keyword in keywords:
+                own_classes.setdefault(keyword.lower(), set()).add(keyword_class)
         
-        self.db = JobDatabase()
-        self.notifier = NotificationManager()
-        self.date_parser = DateParser()
+        patterns = {keyword: self.keyword_pattern(keyword) for keyword in own_classes}
+        self.classes_by_keyword = {}
+        for keyword in own_classes:
+            classes = set(own_classes[keyword])
+            for other, pattern in patterns.items():
+                if other != keyword and re.search(pattern, keyword):
+                    classes |= own_classes[other]
+            self.classes_by_keyword[keyword] = frozenset(classes)
         
-        # Expanded tech keywords for better detection
-        self.tech_keywords = [
-            'engineer', 'developer', 'software', 'programmer', 'sde', 'swe',
-            'analyst', 'scientist', 'architect', 'intern', 'associate', 'dev',
-            'coder', 'qa', 'quality assurance', 'devops', 'full stack', 'frontend',
-            'backend', 'data', 'machine learning', 'ai', 'cloud', 'security',
-            'mobile', 'web', 'application', 'systems', 'technical', 'it'
-        ]
+        # A flat alternation retries every keyword at every word start; a trie shares prefixes
+        trie = {}
+        for keyword in own_classes:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = self.needs_end_boundary(keyword)
+        # Matching the separator instead of a lookbehind lets the regex engine skip
+        # through words quickly; texts are scanned with a leading space prepended.
+        self.pattern = re.compile(r'[^a-z0-9](' + self.trie_pattern(trie) + ')')
         
-        # More comprehensive entry-level keywords
-        self.entry_level_keywords = [
-            'entry level', 'entry-level', 'junior', 'jr', 'associate', 'new grad',
-            'recent grad', 'graduate', 'intern', 'trainee', 'level 1', 'level i',
-            'sde i', 'sde 1', 'engineer i', 'engineer 1', '0-2 years', '1-2 years', '2-3 years',
-            'no experience', 'fresh', 'beginner', 'apprentice', 'assistant','1+ years', '2+ years', '3+ years'
-        ]
+        # The same card text is classified by several functions; scan it once
+        self.classes = short_text_cache(maxsize=cache_size)(self.classes)
+    
+    @staticmethod
+    def needs_end_boundary(keyword):
+        """Short keywords must not match as a prefix ('it' in 'item', 'sde i' in 'sde ii')"""
+        return len(keyword.split()[-1]) <= 3
+    
+    @classmethod
+    def keyword_pattern(cls, keyword):
+        """Regex for one keyword with the boundary rules described above"""
+        pattern = r'(?<![a-z0-9])' + re.escape(keyword)
+        if cls.needs_end_boundary(keyword):
+            pattern += r'(?![a-z0-9])'
+        return pattern
+    
+    @classmethod
+    def trie_pattern(cls, node):
+        """Regex for a keyword trie; longer keywords are tried before a keyword ending here"""
+        branches = [re.escape(char) + cls.trie_pattern(child)
+                    for char, child in sorted(node.items()) if char != '']
+        if '' in node:
+            branches.append(r'(?![a-z0-9])' if node[''] else '')
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+    
+    def classes(self, text):
+        """Set of keyword classes present in text"""
+        classes_by_keyword = self.classes_by_keyword
+        keywords = set(self.pattern.findall(' ' + text.lower()))
+        return frozenset().union(*[classes_by_keyword[keyword] for keyword in keywords])
+    
+    def find_line(self, text, keyword_class):
+        """First line of text holding a keyword of the class, or None"""
+        text_lower = ' ' + text.lower()
+        for match in self.pattern.finditer(text_lower):
+            if keyword_class in self.classes_by_keyword[match.group(1)]:
+                return text.split('\n')[text_lower.count('\n', 0, match.start(1))]
+        return None
+    
+    def has(self, text, keyword_class):
+        """True if any keyword of the class appears in text"""
+        return keyword_class in self.classes(text)
+
+class SelectorCascade:
+    """Evaluate a prioritised list of simple CSS selectors in one lxml tree walk
+    
+    Supports the selector forms the scraper uses: ``tag``, ``.class``,
+    ``[attr]``, ``[attr="v"]``, ``[attr*="v"]`` and combinations such as
+    ``div[class*="job"]``. ``select_first`` returns the elements of the
+    highest-priority selector that matched anything, like calling
+    ``soup.select`` on each selector in turn until one returns results.
+    """
+    
+    SELECTOR_PATTERN = re.compile(r'^(?P<tag>[a-z][a-z0-9]*)?(?P<parts>(?:\.[\w-]+|\[[^\]]+\])*)$')
+    PART_PATTERN = re.compile(r'\.(?P<cls>[\w-]+)|\[(?P<attr>[\w-]+)(?:(?P<op>\*?=)"(?P<value>[^"]*)")?\]')
+    
+    def __init__(self, selectors):
+        self.selectors = list(selectors)
+        self._predicates = [self._compile(selector) for selector in self.selectors]
+    
+    def _compile(self, selector):
+        match = self.SELECTOR_PATTERN.match(selector)
+        if not match:
+            raise ValueError(f"Unsupported selector: {selector}")
         
-        # Senior disqualifiers
-        self.senior_keywords = [
-            'senior', 'sr.', 'lead', 'principal', 'staff', 'manager', 'director',
-            'head of', 'vp', 'vice president', 'chief', 'sde iii', 'sde 3',
-            'sde iv', 'sde 4', 'level 3', 'level 4', 'level 5',
-            '5+ years', '6+ years', '7+ years', '8+ years', '9+ years', '10+ years'
-        ]
+        tag = match.group('tag')
+        checks = []
+        for part in self.PART_PATTERN.finditer(match.group('parts')):
+            if part.group('cls'):
+                checks.append(('class', '~=', part.group('cls')))
+            else:
+                checks.append((part.group('attr'), part.group('op'), part.group('value')))
         
-        # USA and remote keywords
-        self.usa_keywords = [
-            'usa', 'united states', 'us', 'remote', 'work from home', 'telecommute',
-            'california', 'ca', 'new york', 'ny', 'texas', 'tx', 'washington', 'wa',
-            'florida', 'fl', 'seattle', 'san francisco', 'chicago', 'boston',
-            'austin', 'denver', 'atlanta', 'los angeles', 'silicon valley',
-            'bay area', 'portland', 'philadelphia', 'phoenix', 'dallas', 'miami'
-        ]
+        def predicate(element):
+            if tag and element.tag != tag:
+                return False
+            for attr, op, value in checks:
+                actual = element.get(attr)
+                if actual is None:
+                    return False
+                if op == '~=' and value not in actual.split():
+                    return False
+                if op == '*=' and value not in actual:
+                    return False
+                if op == '=' and actual != value:
+                    return False
+            return True
+        
+        return predicate
     
-    def create_driver(self):
-        """Create optimized Chrome driver"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--disable-images')
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--window-size=1920,1080')
+    def select_first(self, root):
+        """Return (selector, elements) for the first selector that matches, or (None, [])"""
+        matches = [[] for _ in self.selectors]
+        best = len(self.selectors)  # Selectors ranked below a match can no longer win
         
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.implicitly_wait(3)
-        driver.set_page_load_timeout(self.timeout)
+        for element in root.iter():
+            index = self.match_index(element, best + 1)
+            if index is not None:
+                matches[index].append(element)
+                best = min(best, index)
         
-        return driver
+        if best == len(self.selectors):
+            return None, []
+        return self.selectors[best], matches[best]
     
-    def scrape_with_http(self, company_name, url):
-        """Fast HTTP-based scraping with improved job detection"""
-        jobs = []
+    def match_index(self, element, limit=None):
+        """Index of the highest-priority selector below ``limit`` that matches element, or None"""
+        if not isinstance(element.tag, str):
+            return None  # Comments and processing instructions
+        for index in range(min(limit or len(self.selectors), len(self.selectors))):
+            if self._predicates[index](element):
+                return index
+        return None
+
+class DomainRateLimiter:
+    """Token-bucket rate limiter keyed by registrable domain, shared by every fetch path
+    
+    Callers reserve a token under a short lock and then sleep outside it, so
+    waiting on one domain never delays requests to another. ``acquire`` is
+    for worker threads, ``acquire_async`` for the asyncio fetch engine.
+    """
+    
+    # Public suffixes with two labels that appear on career sites
+    MULTI_LABEL_SUFFIXES = {'co.uk', 'org.uk', 'ac.uk', 'com.au', 'co.jp', 'co.in', 'com.br', 'com.sg', 'co.nz'}
+    
+    def __init__(self, rate=2.0, burst=4, domain_limits=None):
+        self.rate = rate  # Tokens refilled per second
+        self.burst = burst  # Bucket capacity
+        self.domain_limits = domain_limits or {}  # Domain -> (rate, burst) overrides
         
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Multiple strategies to find job elements
-            job_elements = []
-            
-            # Strategy 1: Look for common job selectors
-            job_selectors = [
-                'div[class*="job"]', 'li[class*="job"]', 'article[class*="job"]',
-                'div[class*="position"]', 'div[class*="opening"]', 'div[class*="role"]',
-                'a[href*="/job"]', 'a[href*="/jobs/"]', 'a[href*="/career"]',
-                '[data-job-id]', '[data-automation-id*="job"]', '.search-result',
-                '.job-result', '.position', '.opportunity'
-            ]
-            
-            for selector in job_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    job_elements = elements
-                    logging.debug(f"Found {len(elements)} elements with selector: {selector}")
-                    break
-            
-            # Strategy 2: Look for links with job-related keywords in href or text
-            if not job_elements:
-                all_links = soup.find_all('a', href=True)
-                for link in all_links:
-                    href = link.get('href', '').lower()
-                    text = link.get_text(strip=True).lower()
-                    
-                    # Check if link looks like a job
-                    if (any(keyword in href for keyword in ['/job', '/career', '/position', '/opening']) or
-                        any(keyword in text for keyword in self.tech_keywords) and len(text) > 10):
-                        job_elements.append(link)
-            
-            # Extract job data
-            logging.info(f"Processing {len(job_elements)} potential job elements for {company_name}")
-            
-            for element in job_elements:
-                try:
-                    job_data = self.extract_job_data_http(element, company_name, url)
-                    if job_data and self.is_valid_job(job_data):
-                        jobs.append(job_data)
-                        if len(jobs) >= self.max_jobs_per_company:
-                            break
-                except Exception as e:
-                    logging.debug(f"Error extracting job data: {e}")
-                    continue
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._waits = {}
+    
+    @classmethod
+    def registrable_domain(cls, url):
+        """'nvidia.wd5.myworkdayjobs.com' -> 'myworkdayjobs.com'"""
+        host = (urlparse(url).hostname if '//' in url else url.split(':')[0]) or ''
+        host = host.lower().rstrip('.')
+        labels = host.split('.')
+        if len(labels) <= 2 or host.replace('.', '').isdigit():
+            return host
+        if '.'.join(labels[-2:]) in cls.MULTI_LABEL_SUFFIXES:
+            return '.'.join(labels[-3:])
+        return '.'.join(labels[-2:])
+    
+    def _reserve(self, url):
+        """Take a token (possibly going into debt) and return (domain, seconds to wait)"""
+        domain = self.registrable_domain(url)
+        rate, burst = self.domain_limits.get(domain, (self.rate, self.burst))
+        now = time.monotonic()
+        
+        with self._lock:
+            tokens, updated_at = self._buckets.get(domain, (burst, now))
+            tokens = min(burst, tokens + (now - updated_at) * rate) - 1
+            self._buckets[domain] = (tokens, now)
+        
+        return domain, max(-tokens / rate, 0.0)
+    
+    def _record_wait(self, domain, waited):
+        with self._lock:
+            count, total, longest = self._waits.get(domain, (0, 0.0, 0.0))
+            self._waits[domain] = (count + 1, total + waited, max(longest, waited))
+    
+    def acquire(self, url):
+        """Block the calling thread until the URL's domain has a token"""
+        domain, wait_seconds = self._reserve(url)
+        if wait_seconds:
+            time.sleep(wait_seconds)
+        self._record_wait(domain, wait_seconds)
+    
+    async def acquire_async(self, url):
+        """Suspend the calling coroutine until the URL's domain has a token"""
+        domain, wait_seconds = self._reserve(url)
+        if wait_seconds:
+            await asyncio.sleep(wait_seconds)
+        self._record_wait(domain, wait_seconds)
+    
+    def log_stats(self):
+        """Log and reset wait time for every domain that had to wait"""
+        with self._lock:
+            waits, self._waits = self._waits, {}
+        
+        for domain, (count, total, longest) in sorted(waits.items(), key=lambda item: -item[1][1]):
+            if total > 0:
+                logging.info(f"Rate limit {domain}: {count} requests, waited {total:.1f}s total, "
+                             f"{longest:.1f}s max")
+
+class HttpSessionPool:
+    """Keep-alive HTTP sessions, one per host, with pooled connections and reuse stats"""
+    
+    def __init__(self, headers=None, pool_maxsize=8, host_pool_sizes=None, rate_limiter=None):
+        self.headers = headers or {}
+        self.rate_limiter = rate_limiter
+        self.pool_maxsize = pool_maxsize  # Connections kept alive per host
+        self.host_pool_sizes = host_pool_sizes or {}  # Host suffix -> pool size override
+        
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._requests_per_host = {}
+    
+    def _pool_size_for(self, host):
+        for suffix, size in self.host_pool_sizes.items():
+            if host == suffix or host.endswith('.' + suffix):
+                return size
+        return self.pool_maxsize
+    
+    def _session_for(self, host):
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers.update(self.headers)
+                # A few pools per session leaves room for redirects to a sibling host
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self._pool_size_for(host))
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[host] = session
+                self._requests_per_host[host] = 0
+            
+            self._requests_per_host[host] += 1
+            return session
+    
+    def get(self, url, **kwargs):
+        """GET through the host's session, reusing an open connection when one is idle"""
+        host = urlparse(url).netloc.lower()
+        if self.rate_limiter:
+            self.rate_limiter.acquire(url)
+        return self._session_for(host).get(url, **kwargs)
+    
+    def head(self, url, **kwargs):
+        """HEAD through the host's session, reusing an open connection when one is idle"""
+        host = urlparse(url).netloc.lower()
+        if self.rate_limiter:
+            self.rate_limiter.acquire(url)
+        return self._session_for(host).head(url, **kwargs)
+    
+    def post(self, url, **kwargs):
+        """POST through the host's session, reusing an open connection when one is idle"""
+        host = urlparse(url).netloc.lower()
+        if self.rate_limiter:
+            self.rate_limiter.acquire(url)
+        return self._session_for(host).post(url, **kwargs)
+    
+    def get_stats(self):
+        """Return requests, opened connections and reused connections per host"""
+        with self._lock:
+            sessions = dict(self._sessions)
+            requests_per_host = dict(self._requests_per_host)
+        
+        stats = {}
+        for host, session in sessions.items():
+            pools = session.get_adapter('https://').poolmanager.pools
+            connections = sum(pools[key].num_connections for key in pools.keys())
+            stats[host] = {
+                'requests': requests_per_host[host],
+                'connections': connections,
+                'reused': max(requests_per_host[host] - connections, 0)
+            }
+        return stats
+    
+    def log_stats(self):
+        """Log connection reuse for every host contacted so far"""
+        for host, host_stats in sorted(self.get_stats().items()):
+            logging.info(f"HTTP session {host}: {host_stats['requests']} requests, "
+                         f"{host_stats['connections']} connections opened, {host_stats['reused']} reused")
+    
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+class HttpCache:
+    """Persistent conditional-GET cache for career pages
+    
+    Stores ETag / Last-Modified validators plus a body hash per URL; the
+    least recently used URLs are evicted past ``max_entries``.
+    """
+    
+    def __init__(self, cache_dir='http_cache', max_entries=20000):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        
+        self._lock = threading.Lock()
+        self._index = {}
+        self.stats = {'not_modified': 0, 'same_hash': 0, 'changed': 0}
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as index_file:
+                self._index = json.load(index_file)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable HTTP cache index: {e}")
+        
+        # Older versions also kept every response body here
+        for name in os.listdir(cache_dir):
+            if name.endswith('.body'):
+                os.remove(os.path.join(cache_dir, name))
+    
+    def conditional_headers(self, url):
+        """Return If-None-Match / If-Modified-Since headers for a cached URL"""
+        with self._lock:
+            entry = self._index.get(url)
+        
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def is_unchanged(self, url, status, content):
+        """Check a response against the cache: 304, or a 200 whose body hash matches"""
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                self.stats['changed'] += 1
+                return False
             
-            logging.info(f"Found {len(jobs)} valid jobs from {company_name} (HTTP)")
-            return jobs
+            entry['last_used'] = time.time()
+            if status == 304:
+                self.stats['not_modified'] += 1
+                return True
+            
+            if content is not None and entry.get('body_hash') == hashlib.sha256(content).hexdigest():
+                self.stats['same_hash'] += 1
+                return True
             
+            self.stats['changed'] += 1
+            return False
+    
+    def store(self, url, headers, content):
+        """Store validators and body hash for a page that was just processed
+        
+        Streamed pages pass ``content=None``; only their validators are kept.
+        """
+        with self._lock:
+            self._index[url] = {
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'body_hash': hashlib.sha256(content).hexdigest() if content is not None else None,
+                'last_used': time.time()
+            }
+    
+    def invalidate(self, url):
+        """Forget a URL so the next cycle fetches and parses it again"""
+        with self._lock:
+            self._index.pop(url, None)
+    
+    def save(self):
+        """Write the index to disk, dropping the least recently used URLs, and reset per-cycle stats"""
+        with self._lock:
+            if len(self._index) > self.max_entries:
+                newest = sorted(self._index.items(), key=lambda item: item[1]['last_used'], reverse=True)
+                self._index = dict(newest[:self.max_entries])
+            
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as index_file:
+                json.dump(self._index, index_file)
+            os.replace(tmp_path, self.index_path)
+            
+            logging.info(f"HTTP cache: {self.stats['not_modified']} not modified (304), "
+                         f"{self.stats['same_hash']} unchanged by body hash, {self.stats['changed']} changed")
+            self.stats = {'not_modified': 0, 'same_hash': 0, 'changed': 0}
+
+class CardCache:
+    """Persistent cache of job-card extraction results, keyed by a hash of title, URL and raw text"""
+    
+    def __init__(self, path='card_cache.json', max_entries=20000, ttl_hours=72):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_hours * 3600
+        
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._pending = {}
+        self.stats = {'hits': 0, 'misses': 0, 'expired': 0}
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as cache_file:
+                self._entries = json.load(cache_file)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            logging.error(f"HTTP scraping failed for {company_name}: {e}")
-            return []
+            logging.warning(f"Ignoring unreadable card cache: {e}")
     
-    def scrape_with_selenium(self, company_name, url):
-        """Selenium-based scraping with improved detection"""
-        jobs = []
-        driver = None
+    @staticmethod
+    def card_key(title, url, raw_text):
+        """Content hash identifying one job card"""
+        return hashlib.sha1(f"{title}\x1f{url}\x1f{raw_text}".encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        """Return the cached entry for a card, or None on a miss"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry['created'] > self.ttl_seconds:
+                del self._entries[key]
+                self.stats['expired'] += 1
+                entry = None
+            
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            
+            entry['last_seen'] = now
+            self.stats['hits'] += 1
+            return entry
+    
+    def put(self, key, valid, job=None):
+        """Record a card's validation result; valid cards wait for commit_pending"""
+        now = time.time()
+        entry = {'valid': valid, 'job': None, 'created': now, 'last_seen': now}
+        if job is not None:
+            entry['job'] = {
+                field: value.isoformat() if isinstance(value, datetime) else value
+                for field, value in job.to_dict().items() if field not in ('raw_text', 'job_description')
+            }
         
+        with self._lock:
+            if valid:
+                self._pending[key] = entry
+            else:
+                self._entries[key] = entry
+    
+    def commit_pending(self):
+        """Cache the valid cards of this cycle once their jobs are safely in the database"""
+        with self._lock:
+            self._entries.update(self._pending)
+            self._pending = {}
+    
+    def discard_pending(self):
+        """Drop this cycle's valid cards so they are extracted and saved again next cycle"""
+        with self._lock:
+            self._pending = {}
+    
+    def save(self):
+        """Evict expired and excess entries, write the cache to disk and reset per-cycle stats"""
+        now = time.time()
+        with self._lock:
+            self._entries = {
+                key: entry for key, entry in self._entries.items()
+                if now - entry['created'] <= self.ttl_seconds
+            }
+            if len(self._entries) > self.max_entries:
+                newest = sorted(self._entries.items(), key=lambda item: item[1]['last_seen'], reverse=True)
+                self._entries = dict(newest[:self.max_entries])
+            
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(self._entries, cache_file)
+            os.replace(tmp_path, self.path)
+            
+            lookups = self.stats['hits'] + self.stats['misses']
+            hit_rate = self.stats['hits'] / lookups * 100 if lookups else 0.0
+            logging.info(f"Card cache: {self.stats['hits']} hits, {self.stats['misses']} misses "
+                         f"({hit_rate:.0f}% hit rate), {self.stats['expired']} expired, "
+                         f"{len(self._entries)} entries")
+            self.stats = {'hits': 0, 'misses': 0, 'expired': 0}
+
+class KnownUrlIndex:
+    """Set of url_hash values for every job already stored in the database
+    
+    Loaded once from the jobs table and extended after every successful save,
+    so extraction can drop jobs the database would reject as duplicates
+    before paying for field extraction, validation and the insert. Lookups
+    are a single set membership test and safe from any number of worker
+    threads; ``add_many`` and ``load`` swap or extend the set under a lock.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hashes = set()
+        self.loaded = False
+        self.stats = {'added': 0}
+    
+    def load(self, hashes):
+        """Replace the index with hashes read from the database; None leaves it untouched"""
+        if hashes is None:
+            return
+        with self._lock:
+            self._hashes = hashes
+            self.loaded = True
+        logging.info(f"Known-URL index: loaded {len(hashes)} stored job URLs")
+    
+    def __contains__(self, url):
+        return url_hash(url) in self._hashes
+    
+    def __len__(self):
+        return len(self._hashes)
+    
+    def add_many(self, urls):
+        """Record URLs that are now stored"""
+        hashes = [url_hash(url) for url in urls if url]
+        with self._lock:
+            before = len(self._hashes)
+            self._hashes.update(hashes)
+            self.stats['added'] += len(self._hashes) - before
+    
+    def log_stats(self):
+        with self._lock:
+            logging.info(f"Known-URL index: {len(self._hashes)} URLs, {self.stats['added']} added this cycle")
+            self.stats = {'added': 0}
+
+class AsyncFetchEngine:
+    """Fetch many career pages concurrently on a single asyncio event loop"""
+    
+    def __init__(self, timeout=8, max_concurrency=200, per_host_limit=4, headers=None, rate_limiter=None,
+                 max_bytes=None):
+        self.timeout = timeout
+        self.max_bytes = max_bytes  # Bodies are cut off here; None reads everything
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit  # Concurrent requests allowed against one host
+        self.headers = headers or {}
+    
+    def fetch_all(self, urls, request_headers=None):
+        """Fetch all URLs concurrently and return a dict of url -> fetch result
+        
+        ``request_headers`` optionally maps a URL to extra headers for its request.
+        """
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        if not unique_urls:
+            return {}
+        
+        start_time = time.time()
+        results = asyncio.run(self._fetch_all(unique_urls, request_headers or {}))
+        
+        failed = sum(1 for result in results.values() if result['error'])
+        logging.info(f"Async fetch engine: {len(results)} pages in {time.time() - start_time:.1f}s "
+                     f"({failed} failed, concurrency={self.max_concurrency}, per_host={self.per_host_limit})")
+        return results
+    
+    async def _fetch_all(self, urls, request_headers):
+        global_slots = asyncio.Semaphore(self.max_concurrency)
+        host_slots = {}
+        
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.per_host_limit)
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers) as session:
+            tasks = []
+            for url in urls:
+                host = urlparse(url).netloc.lower()
+                if host not in host_slots:
+                    host_slots[host] = asyncio.Semaphore(self.per_host_limit)
+                tasks.append(self._fetch_one(session, url, request_headers.get(url), global_slots, host_slots[host]))
+            
+            results = await asyncio.gather(*tasks)
+        
+        return dict(zip(urls, results))
+    
+    async def _fetch_one(self, session, url, headers, global_slots, host_slots):
+        """Fetch one page, holding a global slot and a per-host slot while on the network"""
+        result = {'url': url, 'status': None, 'headers': {}, 'content': b'', 'error': None, 'elapsed': 0.0,
+                  'truncated': False}
+        
+        # Wait for the domain's token before taking any slot, so throttled
+        # domains never hold capacity other hosts could use
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async(url)
+        
+        async with host_slots, global_slots:
+            start_time = time.monotonic()
+            try:
+                timeout = aiohttp.ClientTimeout(total=self.timeout)
+                async with session.get(url, headers=headers, timeout=timeout) as response:
+                    result['status'] = response.status
+                    result['headers'] = CaseInsensitiveDict(response.headers)
+                    if response.status >= 400:
+                        result['error'] = f"{response.status} {response.reason} for url: {url}"
+                    elif self.max_bytes is None:
+                        result['content'] = await response.read()
+                    else:
+                        result['content'], result['truncated'] = await self._read_capped(response, url)
+            except asyncio.TimeoutError:
+                result['error'] = f"Timed out after {self.timeout}s for url: {url}"
+            except Exception as e:
+                result['error'] = str(e) or e.__class__.__name__
+            result['elapsed'] = time.monotonic() - start_time
+        
+        return result
+    
+    async def _read_capped(self, response, url):
+        """Read a body up to max_bytes, returning (content, truncated)"""
+        chunks = []
+        total_bytes = 0
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            if total_bytes + len(chunk) > self.max_bytes:
+                chunks.append(chunk[:self.max_bytes - total_bytes])
+                logging.warning(f"Career page truncated at {self.max_bytes // 1024} KB: {url}")
+                return b''.join(chunks), True
+            chunks.append(chunk)
+            total_bytes += len(chunk)
+        return b''.join(chunks), False
+
+class WebDriverPool:
+    """Bounded pool of long-lived headless Chrome drivers for the Selenium strategy
+    
+    The chromedriver binary is resolved once, warm drivers are leased to one
+    company at a time and reset between leases, and a driver is recycled after
+    ``max_uses`` leases or once Chrome grows past ``max_memory_mb``.
+    """
+    
+    def __init__(self, max_size=3, max_uses=25, max_memory_mb=1024, page_load_timeout=8):
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+        self.page_load_timeout = page_load_timeout
+        
+        self._driver_path = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._idle = queue.LifoQueue()  # Most recently used driver is the warmest
+        self._uses = {}
+        self.stats = {'created': 0, 'leased': 0, 'recycled': 0}
+        
+        atexit.register(self.close)
+    
+    def get_driver_path(self):
+        """Resolve the chromedriver binary once per process"""
+        with self._lock:
+            if self._driver_path is None:
+                self._driver_path = ChromeDriverManager().install()
+            return self._driver_path
+    
+    def create_driver(self):
+        """Create optimized Chrome driver"""
+        chrome_options = Options()
+        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--disable-images')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--window-size=1920,1080')
+        
+        service = Service(self.get_driver_path())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver.implicitly_wait(3)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self.stats['created'] += 1
+        return driver
+    
+    @contextmanager
+    def lease(self):
+        """Lease a warm driver for one company, waiting if all drivers are busy"""
+        self._slots.acquire()
+        driver = None
         try:
-            driver = self.create_driver()
-            driver.get(url)
-            time.sleep(3)
-            
-            # Scroll to load content
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self.create_driver()
             
-            # Multiple strategies to find job elements
-            job_selectors = [
-                'div[class*="job"]', 'li[class*="job"]', 'a[href*="/job"]',
-                '[data-testid*="job"]', '[role="listitem"]', '.search-result',
-                '.job-result', '.position', '.opportunity', 'article'
-            ]
+            with self._lock:
+                self._uses[id(driver)] += 1
+                self.stats['leased'] += 1
             
-            job_elements = []
-            for selector in job_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        job_elements = elements
-                        logging.debug(f"Found {len(elements)} elements with selector: {selector}")
-                        break
-                except:
-                    continue
+            yield driver
+        finally:
+            if driver is not None:
+                self._release(driver)
+            self._slots.release()
+    
+    def _release(self, driver):
+        with self._lock:
+            uses = self._uses.get(id(driver), 0)
+        
+        reason = None
+        if uses >= self.max_uses:
+            reason = f"{uses} uses"
+        else:
+            memory_mb = self._memory_mb(driver)
+            if memory_mb > self.max_memory_mb:
+                reason = f"{memory_mb:.0f}MB memory"
+            elif not self._reset(driver):
+                reason = "failed reset"
+        
+        if reason:
+            logging.debug(f"Recycling Chrome driver after {reason}")
+            self._quit(driver)
+            with self._lock:
+                self.stats['recycled'] += 1
+        else:
+            self._idle.put(driver)
+    
+    def _reset(self, driver):
+        """Clear cookies, storage and extra tabs so the next company starts clean"""
+        try:
+            for handle in driver.window_handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+            driver.delete_all_cookies()
+            driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+            driver.get('about:blank')
+            return True
+        except Exception as e:
+            logging.debug(f"Chrome driver reset failed: {e}")
+            return False
+    
+    def _memory_mb(self, driver):
+        """Resident memory of chromedriver plus every Chrome process it spawned"""
+        try:
+            process = psutil.Process(driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except Exception:
+            return 0
+    
+    def _quit(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.debug(f"Error quitting Chrome driver: {e}")
+    
+    def close(self):
+        """Quit every idle driver"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(driver)
+
+class PageReadiness:
+    """Wait until a Selenium page is ready instead of sleeping a fixed time
+    
+    A page is ready as soon as a job-specific selector matches, or once the
+    document has finished loading and its element count has stopped changing.
+    """
+    
+    # One round trip per poll: readyState, DOM size and the first matching selector
+    PROBE_SCRIPT = """
+        var selectors = arguments[0];
+        var match = -1, count = 0;
+        for (var i = 0; i < selectors.length; i++) {
+            var n = 0;
+            try { n = document.querySelectorAll(selectors[i]).length; } catch (e) {}
+            if (n > 0) { match = i; count = n; break; }
+        }
+        return {
+            readyState: document.readyState,
+            nodes: document.getElementsByTagName('*').length,
+            selector: match,
+            matches: count
+        };
+    """
+    
+    def __init__(self, poll_interval=0.25, stable_polls=6):
+        self.poll_interval = poll_interval
+        self.stable_polls = stable_polls  # Unchanged polls in a row that count as a settled DOM
+    
+    def wait(self, driver, selectors, max_wait, strong_selectors=None):
+        """Poll until ready or ``max_wait`` seconds pass
+        
+        Only selectors in ``strong_selectors`` (default: all) end the wait
+        early; generic ones are only trusted once the DOM has settled.
+        Returns a dict with the elapsed seconds, the reason the wait ended and
+        the first matching selector (or None).
+        """
+        strong_selectors = set(selectors if strong_selectors is None else strong_selectors)
+        start_time = time.monotonic()
+        last_nodes = None
+        stable_count = 0
+        probe = {'selector': -1, 'matches': 0}
+        reason = 'timeout'
+        
+        while True:
+            try:
+                probe = driver.execute_script(self.PROBE_SCRIPT, selectors) or probe
+            except Exception as e:
+                logging.debug(f"Readiness probe failed: {e}")
+            
+            matched = selectors[probe['selector']] if probe.get('selector', -1) >= 0 else None
+            if matched in strong_selectors:
+                reason = 'selector'
+                break
+            
+            if probe.get('readyState') == 'complete' and probe.get('nodes') == last_nodes:
+                stable_count += 1
+                if stable_count >= self.stable_polls:
+                    reason = 'stable'
+                    break
+            else:
+                stable_count = 0
+            last_nodes = probe.get('nodes')
             
-            # Fallback: find all links and filter
-            if not job_elements:
-                all_links = driver.find_elements(By.TAG_NAME, "a")
-                for link in all_links:
-                    try:
-                        href = link.get_attribute('href') or ''
-                        text = link.text.strip()
-                        if (any(keyword in href.lower() for keyword in ['/job', '/career']) or
-                            any(keyword in text.lower() for keyword in self.tech_keywords)):
-                            job_elements.append(link)
-                    except:
-                        continue
-            
-            logging.info(f"Processing {len(job_elements)} potential job elements for {company_name}")
-            
-            # Extract job data
-            for element in job_elements:
-                try:
-                    job_data = self.extract_job_data_selenium(element, company_name, url)
-                    if job_data and self.is_valid_job(job_data):
-                        jobs.append(job_data)
-                        if len(jobs) >= self.max_jobs_per_company:
-                            break
-                except Exception as e:
-                    logging.debug(f"Error extracting job data: {e}")
-                    continue
+            if time.monotonic() - start_time >= max_wait:
+                break
+            time.sleep(self.poll_interval)
+        
+        return {
+            'seconds': time.monotonic() - start_time,
+            'reason': reason,
+            'selector': matched,
+            'matches': probe.get('matches', 0)
+        }
+
+class AtsClient:
+    """Fetch listings straight from applicant-tracking-system JSON APIs
+    
+    Supports Workday (``*.myworkdayjobs.com``), Greenhouse and Lever career
+    sites. Listings come back newest first as plain dicts with title, url,
+    location, date_posted, employment_type and raw_text. Workday and Lever
+    are read for at most max_pages pages in the order the API serves them,
+    so on larger boards only the listings on those pages are sorted; newer
+    postings on later pages are not fetched.
+    """
+    
+    def __init__(self, http_sessions, timeout=8, page_size=20, max_pages=5):
+        self.http_sessions = http_sessions
+        self.timeout = timeout
+        self.page_size = page_size  # Workday rejects pages larger than 20
+        self.max_pages = max_pages
+    
+    def detect(self, url):
+        """Return (ats_name, info) for a supported ATS URL, or None"""
+        parsed = urlparse(url or '')
+        host = parsed.netloc.lower()
+        segments = [segment for segment in parsed.path.split('/') if segment]
+        
+        if host.endswith('.myworkdayjobs.com'):
+            # Skip an optional locale segment such as /en-US/
+            site_segments = [segment for segment in segments if not re.fullmatch(r'[a-z]{2}-[A-Z]{2}', segment)]
+            if site_segments:
+                return 'workday', {'host': host, 'tenant': host.split('.')[0], 'site': site_segments[0]}
+        
+        if host in ('boards.greenhouse.io', 'job-boards.greenhouse.io'):
+            board = re.search(r'(?:^|&)for=([^&]+)', parsed.query)
+            if board:
+                return 'greenhouse', {'board': board.group(1)}
+            if segments and segments[0] != 'embed':
+                return 'greenhouse', {'board': segments[0]}
+        
+        if host == 'jobs.lever.co' and segments:
+            return 'lever', {'company': segments[0]}
+        
+        return None
+    
+    def fetch_listings(self, url):
+        """Fetch the listings for a detected ATS URL (up to max_pages pages), newest first"""
+        ats_name, info = self.detect(url)
+        fetcher = {
+            'workday': self._fetch_workday,
+            'greenhouse': self._fetch_greenhouse,
+            'lever': self._fetch_lever
+        }[ats_name]
+        
+        listings = fetcher(info)
+        listings.sort(key=lambda listing: listing['posted_date'] or datetime.min, reverse=True)
+        return listings
+    
+    def _fetch_workday(self, info):
+        api_url = f"https://{info['host']}/wday/cxs/{info['tenant']}/{info['site']}/jobs"
+        listings = []
+        total = 0
+        
+        for page in range(self.max_pages):
+            response = self.http_sessions.post(api_url, json={
+                'appliedFacets': {},
+                'limit': self.page_size,
+                'offset': page * self.page_size,
+                'searchText': ''
+            }, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+            postings = data.get('jobPostings', [])
+            # Later pages may report a total of 0, so the first page's count is kept
+            total = data.get('total') or total
+            
+            for posting in postings:
+                # "Posted 30+ Days Ago" -> "30 days ago", which DateParser understands
+                posted_on = re.sub(r'(\d+)\+', r'\1', (posting.get('postedOn') or '').lower())
+                date_posted = posted_on.replace('posted', '', 1).strip()
+                listings.append(self._listing(
+                    title=posting.get('title', ''),
+                    url=f"https://{info['host']}/{info['site']}{posting.get('externalPath', '')}",
+                    location=posting.get('locationsText', ''),
+                    date_posted=date_posted,
+                    posted_date=DateParser.parse_relative_date(date_posted),
+                    details=posting.get('bulletFields', [])
+                ))
             
-            logging.info(f"Found {len(jobs)} valid jobs from {company_name} (Selenium)")
-            return jobs
+            if len(postings) < self.page_size or (page + 1) * self.page_size >= total:
+                break
+        
+        return listings
+    
+    def _fetch_greenhouse(self, info):
+        api_url = f"https://boards-api.greenhouse.io/v1/boards/{info['board']}/jobs"
+        response = self.http_sessions.get(api_url, timeout=self.timeout)
+        response.raise_for_status()
+        
+        listings = []
+        for posting in response.json().get('jobs', []):
+            posted_date = self._parse_iso_date(posting.get('first_published') or posting.get('updated_at'))
+            listings.append(self._listing(
+                title=posting.get('title', ''),
+                url=posting.get('absolute_url', ''),
+                location=(posting.get('location') or {}).get('name', ''),
+                date_posted=self._format_age(posted_date),
+                posted_date=posted_date
+            ))
+        return listings
+    
+    def _fetch_lever(self, info):
+        api_url = f"https://api.lever.co/v0/postings/{info['company']}"
+        page_size = 100
+        listings = []
+        
+        for page in range(self.max_pages):
+            response = self.http_sessions.get(api_url, params={
+                'mode': 'json', 'skip': page * page_size, 'limit': page_size
+            }, timeout=self.timeout)
+            response.raise_for_status()
+            postings = response.json()
+            
+            for posting in postings:
+                categories = posting.get('categories') or {}
+                created_at = posting.get('createdAt')
+                posted_date = datetime.fromtimestamp(created_at / 1000) if created_at else None
+                listings.append(self._listing(
+                    title=posting.get('text', ''),
+                    url=posting.get('hostedUrl', ''),
+                    location=categories.get('location', ''),
+                    date_posted=self._format_age(posted_date),
+                    posted_date=posted_date,
+                    employment_type=categories.get('commitment', ''),
+                    details=[categories.get('team', ''), posting.get('descriptionPlain', '')]
+                ))
             
-        except Exception as e:
-            logging.error(f"Selenium scraping failed for {company_name}: {e}")
-            return []
-        finally:
-            if driver:
-                driver.quit()
+            if len(postings) < page_size:
+                break
+        
+        return listings
+    
+    def _listing(self, title, url, location, date_posted, posted_date, employment_type='', details=None):
+        raw_text = ' '.join(part for part in [title, location, employment_type, *(details or [])] if part)
+        return {
+            'title': title.strip(),
+            'url': canonicalize_url(url) if url else '',
+            'location': location or '',
+            'date_posted': date_posted,
+            'posted_date': posted_date,
+            'employment_type': employment_type or '',
+            'raw_text': raw_text
+        }
+    
+    @staticmethod
+    def _parse_iso_date(value):
+        if not value:
+            return None
+        try:
+            # Compare against naive local timestamps like the rest of the scraper
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).astimezone().replace(tzinfo=None)
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _format_age(posted_date):
+        """Render a timestamp the way career pages do, e.g. '3 days ago'"""
+        if not posted_date:
+            return ''
+        days = (datetime.now() - posted_date).days
+        if days <= 0:
+            return 'today'
+        if days == 1:
+            return 'yesterday'
+        return f'{days} days ago'
+
+class HostHealthTracker:
+    """Per-host failure tracking with exponential backoff and a circuit breaker
+    
+    Every failure (4xx/5xx, timeout, connection error) pushes the host's next
+    allowed attempt further out. After ``failure_threshold`` failures in a
+    row the circuit opens: once the backoff expires a single cheap probe is
+    let through, and only a successful probe closes the circuit again.
+    """
+    
+    def __init__(self, failure_threshold=3, base_backoff_minutes=45, max_backoff_hours=24):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = timedelta(minutes=base_backoff_minutes)
+        self.max_backoff = timedelta(hours=max_backoff_hours)
+        
+        self._lock = threading.Lock()
+        self._hosts = {}
+        self._probing = set()
+        self._changed = set()
+    
+    def load(self, hosts):
+        """Replace in-memory state with state loaded from the database"""
+        with self._lock:
+            self._hosts = hosts
+            for entry in self._hosts.values():
+                # A probe interrupted by a restart never reported back
+                if entry['state'] == 'half_open':
+                    entry['state'] = 'open'
+            self._probing.clear()
+            self._changed.clear()
+    
+    def check(self, host):
+        """Return 'allow', 'probe' (caller must send one cheap request) or 'skip'"""
+        with self._lock:
+            entry = self._hosts.get(host)
+            if not entry or not entry['retry_at'] or datetime.now() >= entry['retry_at']:
+                if entry and entry['state'] in ('open', 'half_open'):
+                    if host in self._probing:
+                        return 'skip'
+                    self._probing.add(host)
+                    entry['state'] = 'half_open'
+                    self._changed.add(host)
+                    return 'probe'
+                return 'allow'
+            return 'skip'
+    
+    def record_success(self, host):
+        with self._lock:
+            self._probing.discard(host)
+            entry = self._hosts.get(host)
+            if entry and (entry['failures'] or entry['state'] != 'closed'):
+                if entry['state'] != 'closed':
+                    logging.info(f"Circuit closed for {host}")
+                self._hosts[host] = {'state': 'closed', 'failures': 0, 'retry_at': None, 'last_error': None}
+                self._changed.add(host)
+    
+    def record_failure(self, host, error):
+        with self._lock:
+            self._probing.discard(host)
+            entry = self._hosts.setdefault(host, {'state': 'closed', 'failures': 0, 'retry_at': None, 'last_error': None})
+            entry['failures'] += 1
+            entry['last_error'] = str(error)[:500]
+            
+            backoff = min(self.base_backoff * (2 ** (entry['failures'] - 1)), self.max_backoff)
+            entry['retry_at'] = datetime.now() + backoff
+            
+            if entry['failures'] >= self.failure_threshold:
+                if entry['state'] == 'closed':
+                    logging.warning(f"Circuit open for {host} after {entry['failures']} failures, "
+                                    f"next probe in {backoff}")
+                elif entry['state'] == 'half_open':
+                    logging.info(f"Probe failed for {host}, circuit stays open for {backoff}")
+                entry['state'] = 'open'
+            self._changed.add(host)
+    
+    def changed_hosts(self):
+        """Hosts whose state changed since the last load or call, for persisting"""
+        with self._lock:
+            changed = {host: dict(self._hosts[host]) for host in self._changed if host in self._hosts}
+            self._changed.clear()
+            return changed
+
+class TieredExecutor:
+    """Independently sized thread pools per kind of work, with queue metrics
+    
+    Cheap HTTP/ATS companies and slow browser companies get their own pools,
+    so a handful of Chrome pages can never hold the slots HTTP work needs.
+    """
+    
+    def __init__(self, tier_sizes):
+        self.tier_sizes = dict(tier_sizes)
+        self.pools = {
+            tier: ThreadPoolExecutor(max_workers=size, thread_name_prefix=f"{tier}-tier")
+            for tier, size in self.tier_sizes.items()
+        }
+        
+        self._lock = threading.Lock()
+        self.metrics = {
+            tier: {'submitted': 0, 'started': 0, 'max_queue_depth': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+            for tier in self.tier_sizes
+        }
+    
+    def submit(self, tier, fn, *args):
+        """Queue work on a tier, recording queue depth now and wait time once it starts"""
+        submitted_at = time.monotonic()
+        with self._lock:
+            metrics = self.metrics[tier]
+            metrics['submitted'] += 1
+            queue_depth = metrics['submitted'] - metrics['started']
+            metrics['max_queue_depth'] = max(metrics['max_queue_depth'], queue_depth)
+        
+        def run():
+            waited = time.monotonic() - submitted_at
+            with self._lock:
+                metrics['started'] += 1
+                metrics['total_wait'] += waited
+                metrics['max_wait'] = max(metrics['max_wait'], waited)
+            return fn(*args)
+        
+        return self.pools[tier].submit(run)
+    
+    def log_metrics(self):
+        for tier, metrics in self.metrics.items():
+            avg_wait = metrics['total_wait'] / metrics['started'] if metrics['started'] else 0.0
+            logging.info(f"{tier} tier ({self.tier_sizes[tier]} workers): {metrics['submitted']} tasks, "
+                         f"max queue depth {metrics['max_queue_depth']}, "
+                         f"avg wait {avg_wait:.1f}s, max wait {metrics['max_wait']:.1f}s")
+    
+    def shutdown(self):
+        for pool in self.pools.values():
+            pool.shutdown(wait=True)
+
+class JobPageParser:
+    """Find job cards in career pages and read them into validated JobRecords"""
+    
+    # Subtrees that never hold job text: skipped when reading text, and dropped as soon
+    # as the stream parser closes them
+    STREAM_PRUNED_TAGS = {'script', 'style', 'noscript', 'svg', 'template', 'iframe'}
+    
+    def __init__(self, max_days_old=7):
+        self.max_days_old = max_days_old  # Only scrape jobs from last N days
+        self.date_parser = DateParser()
+        
+        # Expanded tech keywords for better detection
+        self.tech_keywords = [
+            'engineer', 'developer', 'software', 'programmer', 'sde', 'swe',
+            'analyst', 'scientist', 'architect', 'intern', 'associate', 'dev',
+            'coder', 'qa', 'quality assurance', 'devops', 'full stack', 'frontend',
+            'backend', 'data', 'machine learning', 'ai', 'cloud', 'security',
+            'mobile', 'web', 'application', 'systems', 'technical', 'it'
+        ]
+        
+        # More comprehensive entry-level keywords
+        self.entry_level_keywords = [
+            'entry level', 'entry-level', 'junior', 'jr', 'associate', 'new grad',
+            'recent grad', 'graduate', 'intern', 'trainee', 'level 1', 'level i',
+            'sde i', 'sde 1', 'engineer i', 'engineer 1', '0-2 years', '1-2 years', '2-3 years',
+            'no experience', 'fresh', 'beginner', 'apprentice', 'assistant','1+ years', '2+ years', '3+ years'
+        ]
+        
+        # Job card selectors for HTTP pages, in priority order
+        self.http_job_selectors = [
+            'div[class*="job"]', 'li[class*="job"]', 'article[class*="job"]',
+            'div[class*="position"]', 'div[class*="opening"]', 'div[class*="role"]',
+            'a[href*="/job"]', 'a[href*="/jobs/"]', 'a[href*="/career"]',
+            '[data-job-id]', '[data-automation-id*="job"]', '.search-result',
+            '.job-result', '.position', '.opportunity'
+        ]
+        self.selector_cascade = SelectorCascade(self.http_job_selectors)
+        
+        # Job card selectors for Selenium pages, in priority order
+        self.selenium_job_selectors = [
+            'div[class*="job"]', 'li[class*="job"]', 'a[href*="/job"]',
+            '[data-testid*="job"]', '[role="listitem"]', '.search-result',
+            '.job-result', '.position', '.opportunity', 'article'
+        ]
+        # Too generic to end a readiness wait on their own (navigation lists, news cards)
+        self.generic_job_selectors = ['[role="listitem"]', 'article']
+        
+        # Senior disqualifiers
+        self.senior_keywords = [
+            'senior', 'sr.', 'lead', 'principal', 'staff', 'manager', 'director',
+            'head of', 'vp', 'vice president', 'chief', 'sde iii', 'sde 3',
+            'sde iv', 'sde 4', 'level 3', 'level 4', 'level 5',
+            '5+ years', '6+ years', '7+ years', '8+ years', '9+ years', '10+ years'
+        ]
+        
+        # USA and remote keywords
+        self.usa_keywords = [
+            'usa', 'united states', 'us', 'remote', 'work from home', 'telecommute',
+            'california', 'ca', 'new york', 'ny', 'texas', 'tx', 'washington', 'wa',
+            'florida', 'fl', 'seattle', 'san francisco', 'chicago', 'boston',
+            'austin', 'denver', 'atlanta', 'los angeles', 'silicon valley',
+            'bay area', 'portland', 'philadelphia', 'phoenix', 'dallas', 'miami'
+        ]
+        
+        # International locations that rule out a job with no USA keyword
+        self.international_keywords = [
+            'london', 'uk', 'canada', 'toronto', 'vancouver', 'india', 'bangalore',
+            'hyderabad', 'mumbai', 'delhi', 'china', 'beijing', 'shanghai',
+            'europe', 'germany', 'france', 'australia', 'singapore', 'japan'
+        ]
+        
+        # One compiled matcher shared by every classification function
+        self.keyword_matcher = KeywordMatcher({
+            'tech': self.tech_keywords,
+            'entry': self.entry_level_keywords,
+            'senior': self.senior_keywords,
+            'usa': self.usa_keywords,
+            'international': self.international_keywords
+        })
+    
+    def iter_job_elements_stream(self, chunks):
+        """Yield candidate job elements as they close, clearing each one once a later match is outside it"""
+        parser = lxml.etree.HTMLPullParser(events=('end',))
+        best = len(self.http_job_selectors)
+        pending = None  # Last yielded element, released once a match outside it comes along
+        
+        def release(element):
+            element.clear(keep_tail=True)
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+        
+        def matching_elements():
+            nonlocal best, pending
+            for _, element in parser.read_events():
+                if element.tag in self.STREAM_PRUNED_TAGS:
+                    element.clear(keep_tail=True)
+                    continue
+                index = self.selector_cascade.match_index(element, best + 1)
+                if index is not None:
+                    best = min(best, index)
+                    # A card enclosing the previous match still needs its content
+                    if pending is not None and element not in pending.iterancestors():
+                        release(pending)
+                    pending = element
+                    yield element
+        
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from matching_elements()
+        root = parser.close()
+        yield from matching_elements()
+        
+        # Strategy 2: Look for links with job-related keywords in href or text
+        if best == len(self.http_job_selectors) and root is not None:
+            for link in root.iter('a'):
+                if link.get('href') is not None and self.is_job_link(link.get('href'), self.lxml_text(link, '')):
+                    yield link
+    
+    def is_job_link(self, href, text):
+        """Fallback check for pages where no job selector matched"""
+        href = href.lower()
+        text = text.lower()
+        return (any(keyword in href for keyword in ['/job', '/career', '/position', '/opening']) or
+                self.keyword_matcher.has(text, 'tech') and len(text) > 10)
+    
+    def find_job_elements_soup(self, content):
+        """Find candidate job elements with BeautifulSoup, one select() per selector"""
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # Strategy 1: Look for common job selectors
+        for selector in self.http_job_selectors:
+            elements = soup.select(selector)
+            if elements:
+                logging.debug(f"Found {len(elements)} elements with selector: {selector}")
+                return elements
+        
+        # Strategy 2: Look for links with job-related keywords in href or text
+        return [
+            link for link in soup.find_all('a', href=True)
+            if self.is_job_link(link.get('href', ''), link.get_text(strip=True))
+        ]
     
-    def extract_job_data_http(self, element, company_name, base_url):
-        """Extract job data from BeautifulSoup element"""
+    def find_job_elements_lxml(self, content):
+        """Find candidate job elements with lxml, evaluating the whole selector cascade in one pass"""
+        root = lxml.html.fromstring(content)
+        
+        # Strategy 1: Look for common job selectors
+        selector, elements = self.selector_cascade.select_first(root)
+        if elements:
+            logging.debug(f"Found {len(elements)} elements with selector: {selector}")
+            return elements
+        
+        # Strategy 2: Look for links with job-related keywords in href or text
+        return [
+            link for link in root.iter('a')
+            if link.get('href') is not None and self.is_job_link(link.get('href'), self.lxml_text(link, ''))
+        ]
+    
+    @classmethod
+    def lxml_text(cls, element, separator=' '):
+        """Equivalent of BeautifulSoup's get_text(separator, strip=True) for lxml elements"""
+        return separator.join(text.strip() for text in cls.iter_lxml_text(element) if text.strip())
+    
+    @classmethod
+    def iter_lxml_text(cls, element):
+        """Text pieces under an element, like itertext() but skipping STREAM_PRUNED_TAGS subtrees"""
+        if element.tag in cls.STREAM_PRUNED_TAGS:
+            return
+        if isinstance(element.tag, str) and element.text:
+            yield element.text
+        for child in element:
+            yield from cls.iter_lxml_text(child)
+            if child.tail:
+                yield child.tail
+    
+    def read_candidate_http(self, element, base_url):
+        """Read title, URL and raw text from a BeautifulSoup element"""
         try:
             raw_text = element.get_text(separator=' ', strip=True)
             
@@ -617,7 +2338,7 @@ class ImprovedJobScraper:
                     lines = raw_text.split('\n')
                     for line in lines:
                         line = line.strip()
-                        if len(line) > 10 and any(keyword in line.lower() for keyword in self.tech_keywords):
+                        if len(line) > 10 and self.keyword_matcher.has(line, 'tech'):
                             title = line
                             break
             
@@ -630,203 +2351,158 @@ class ImprovedJobScraper:
                 if link:
                     url = link.get('href')
             
-            if url and not url.startswith('http'):
-                url = urljoin(base_url, url)
+            if url:
+                url = canonicalize_url(url, base_url)
             
-            # Extract location
-            location = self.extract_location(raw_text)
+            return title, url, raw_text
             
-            # Extract date posted
-            date_posted = self.extract_date_posted(raw_text)
+        except Exception as e:
+            logging.debug(f"Error in read_candidate_http: {e}")
+            return None
+    
+    def read_candidate_lxml(self, element, base_url):
+        """Read title, URL and raw text from a lxml element"""
+        try:
+            raw_text = self.lxml_text(element)
             
-            return {
-                'company_name': company_name,
-                'job_title': title,
-                'job_url': url,
-                'location': location,
-                'job_description': raw_text[:500],
-                'experience_required': self.analyze_experience_level(title, raw_text),
-                'posted_date': self.date_parser.parse_relative_date(date_posted),
-                'date_posted': date_posted,
-                'salary': self.extract_salary(raw_text),
-                'employment_type': self.extract_employment_type(raw_text),
-                'raw_text': raw_text
-            }
+            # Extract title
+            title = ""
+            if element.tag == 'a':
+                title = self.lxml_text(element, '')
+            else:
+                # Look for title in various elements
+                title_elem = next(element.iterdescendants('h1', 'h2', 'h3', 'h4', 'h5'), None)
+                if title_elem is not None:
+                    title = self.lxml_text(title_elem, '')
+                else:
+                    # Use first line that looks like a title
+                    for line in raw_text.split('\n'):
+                        line = line.strip()
+                        if len(line) > 10 and self.keyword_matcher.has(line, 'tech'):
+                            title = line
+                            break
+            
+            # Extract URL
+            url = ""
+            if element.tag == 'a':
+                url = element.get('href')
+            else:
+                link = next(element.iterdescendants('a'), None)
+                if link is not None:
+                    url = link.get('href')
+            
+            if url:
+                url = canonicalize_url(url, base_url)
+            
+            return title, url, raw_text
             
         except Exception as e:
-            logging.debug(f"Error in extract_job_data_http: {e}")
+            logging.debug(f"Error in read_candidate_lxml: {e}")
             return None
     
-    def extract_job_data_selenium(self, element, company_name, base_url):
-        """Extract job data from Selenium element"""
+    def read_candidate_selenium(self, card, base_url):
+        """Read title, URL and raw text from a card collected in the browser by CARD_SCRIPT"""
         try:
-            raw_text = element.text.strip()
+            raw_text = card['text']
             
             # Extract title
-            title = ""
-            try:
-                title_elem = element.find_element(By.CSS_SELECTOR, 'h1, h2, h3, h4, h5')
-                title = title_elem.text.strip()
-            except:
+            title = card['title']
+            if title is None:
                 # Use first line that looks like a title
+                title = ""
                 lines = raw_text.split('\n')
                 for line in lines:
                     line = line.strip()
-                    if len(line) > 10 and any(keyword in line.lower() for keyword in self.tech_keywords):
+                    if len(line) > 10 and self.keyword_matcher.has(line, 'tech'):
                         title = line
                         break
             
             # Extract URL
-            url = ""
-            if element.tag_name == 'a':
-                url = element.get_attribute('href')
-            else:
-                try:
-                    link = element.find_element(By.TAG_NAME, 'a')
-                    url = link.get_attribute('href')
-                except:
-                    pass
-            
-            if url and not url.startswith('http'):
-                url = urljoin(base_url, url)
-            
-            # Extract location
-            location = self.extract_location(raw_text)
+            url = card['href'] or ""
             
-            # Extract date posted
-            date_posted = self.extract_date_posted(raw_text)
+            if url:
+                url = canonicalize_url(url, base_url)
             
-            return {
-                'company_name': company_name,
-                'job_title': title,
-                'job_url': url,
-                'location': location,
-                'job_description': raw_text[:500],
-                'experience_required': self.analyze_experience_level(title, raw_text),
-                'posted_date': self.date_parser.parse_relative_date(date_posted),
-                'date_posted': date_posted,
-                'salary': self.extract_salary(raw_text),
-                'employment_type': self.extract_employment_type(raw_text),
-                'raw_text': raw_text
-            }
+            return title, url, raw_text
             
         except Exception as e:
-            logging.debug(f"Error in extract_job_data_selenium: {e}")
+            logging.debug(f"Error in read_candidate_selenium: {e}")
             return None
     
+    def build_job_data(self, company_name, title, url, raw_text, location=None, date_posted=None,
+                       employment_type=None):
+        """Build the JobRecord shared by every extraction path
+        
+        Fields already known from a structured source are passed in; the rest
+        are extracted from the raw text.
+        """
+        # Same text as analyze_experience_level, so the regex pass is shared through the cache
+        fields = extract_text_fields(f"{title}\n{raw_text}")
+        if location is None:
+            location = self.extract_location(raw_text)
+        if date_posted is None:
+            date_posted = fields['date_posted']
+        if not employment_type:
+            employment_type = fields['employment_type']
+        
+        return JobRecord(
+            company_name=company_name,
+            job_title=title,
+            job_url=url,
+            location=location,
+            experience_required=self.analyze_experience_level(title, raw_text),
+            posted_date=self.date_parser.parse_relative_date(date_posted),
+            date_posted=date_posted,
+            salary=fields['salary'],
+            employment_type=employment_type,
+            raw_text=raw_text
+        )
+    
+    def is_recent_posting(self, title, raw_text, date_posted=None):
+        """The recency check of is_valid_job, run on a card's text without building the job"""
+        if date_posted is None:
+            date_posted = extract_text_fields(f"{title}\n{raw_text}")['date_posted']
+        return self.date_parser.is_recent_job(date_posted, self.max_days_old)
+    
     def extract_location(self, text):
         """Extract location from job text"""
-        text_lower = text.lower()
-        
-        # Look for USA keywords
-        for keyword in self.usa_keywords:
-            if keyword in text_lower:
-                # Try to extract the surrounding context
-                lines = text.split('\n')
-                for line in lines:
-                    if keyword in line.lower():
-                        return line.strip()[:100]
+        # Return the line holding the first USA keyword
+        line = self.keyword_matcher.find_line(text, 'usa')
+        if line is not None:
+            return line.strip()[:100]
         
         return ""
     
     def extract_date_posted(self, text):
         """Extract date posted from job text"""
-        # Common date patterns
-        date_patterns = [
-            r'(\d+\s*days?\s*ago)',
-            r'(\d+\s*hours?\s*ago)',
-            r'(\d+\s*weeks?\s*ago)',
-            r'(yesterday)',
-            r'(today)',
-            r'(just now)',
-            r'(last week)',
-            r'(posted\s+\d+\s*days?\s*ago)',
-            r'(posted\s+yesterday)',
-            r'(posted\s+today)'
-        ]
-        
-        text_lower = text.lower()
-        for pattern in date_patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                return match.group(1)
-        
-        return ""
+        return extract_text_fields(text)['date_posted']
     
     def extract_salary(self, text):
         """Extract salary information from job text"""
-        salary_patterns = [
-            r'\$[\d,]+\s*-\s*\$[\d,]+',
-            r'\$[\d,]+k?\s*-\s*\$?[\d,]+k?',
-            r'salary:\s*\$[\d,]+',
-            r'[\d,]+k?\s*-\s*[\d,]+k?\s*(?:per year|annually)'
-        ]
-        
-        for pattern in salary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        
-        return ""
+        return extract_text_fields(text)['salary']
     
     def extract_employment_type(self, text):
         """Extract employment type from job text"""
-        text_lower = text.lower()
-        
-        employment_types = {
-            'full-time': 'Full-time',
-            'full time': 'Full-time', 
-            'part-time': 'Part-time',
-            'part time': 'Part-time',
-            'contract': 'Contract',
-            'contractor': 'Contract',
-            'internship': 'Internship',
-            'intern': 'Internship',
-            'temporary': 'Temporary',
-            'remote': 'Remote'
-        }
-        
-        for key, value in employment_types.items():
-            if key in text_lower:
-                return value
-        
-        return ""
+        return extract_text_fields(text)['employment_type']
     
     def analyze_experience_level(self, title, description):
         """Improved experience level analysis"""
-        title_lower = title.lower()
-        desc_lower = description.lower()
-        full_text = f"{title_lower} {desc_lower}"
+        title_classes = self.keyword_matcher.classes(title)
         
         # Check for senior indicators in title (strict)
-        if any(keyword in title_lower for keyword in self.senior_keywords):
+        if 'senior' in title_classes:
             return "Senior Level"
         
         # Check for explicit entry level indicators
-        if any(keyword in full_text for keyword in self.entry_level_keywords):
+        if 'entry' in title_classes or 'entry' in self.keyword_matcher.classes(description):
             return "Entry Level"
         
         # Check for year requirements
-        year_patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience|exp)',
-            r'minimum\s*(\d+)\s*years?',
-            r'(\d+)\s*to\s*(\d+)\s*years?',
-            r'(\d+)-(\d+)\s*years?'
-        ]
-        
-        for pattern in year_patterns:
-            matches = re.findall(pattern, full_text)
-            for match in matches:
-                if isinstance(match, tuple):
-                    years = [int(x) for x in match if x.isdigit()]
-                    min_years = min(years) if years else 0
-                else:
-                    min_years = int(match) if match.isdigit() else 0
-                
-                if min_years <= 2:
-                    return "Entry Level"
-                elif min_years > 3:
-                    return "Senior Level"
+        for min_years in extract_text_fields(f"{title}\n{description}")['experience_years']:
+            if min_years <= 2:
+                return "Entry Level"
+            elif min_years > 3:
+                return "Senior Level"
         
         # Default to entry level for ambiguous cases
         return "Entry Level"
@@ -846,11 +2522,11 @@ class ImprovedJobScraper:
         if not job_data.get('job_url'):
             return False
         
-        # Must be tech-related (more lenient)
-        if not any(keyword in title for keyword in self.tech_keywords):
-            # Check description too
-            if not any(keyword in description for keyword in self.tech_keywords):
-                return False
+        # Must be tech-related (more lenient), checking the description too
+        text_classes = (self.keyword_matcher.classes(job_data.get('job_title', '')) |
+                        self.keyword_matcher.classes(job_data.get('job_description', '')))
+        if 'tech' not in text_classes:
+            return False
         
         # Skip obvious senior roles
         if 'senior' in experience.lower():
@@ -862,16 +2538,10 @@ class ImprovedJobScraper:
             return False
         
         # Must be in USA or remote (more lenient)
-        full_text = f"{title} {description} {location}"
-        if not any(keyword in full_text for keyword in self.usa_keywords):
+        text_classes |= self.keyword_matcher.classes(job_data.get('location', ''))
+        if 'usa' not in text_classes:
             # Check if it mentions any international locations (exclude those)
-            international_keywords = [
-                'london', 'uk', 'canada', 'toronto', 'vancouver', 'india', 'bangalore',
-                'hyderabad', 'mumbai', 'delhi', 'china', 'beijing', 'shanghai',
-                'europe', 'germany', 'france', 'australia', 'singapore', 'japan'
-            ]
-            
-            if any(keyword in full_text for keyword in international_keywords):
+            if 'international' in text_classes:
                 return False
             
             # If no location specified, assume it might be USA (more lenient)
@@ -881,43 +2551,629 @@ class ImprovedJobScraper:
                 return False
         
         return True
+
+class ScraperConfig:
+    """Tunables of ImprovedJobScraper; pass the ones to change as keyword arguments"""
+    
+    # Fetching
+    fetch_mode = 'async'  # 'async' prefetches HTTP pages on one event loop, 'threaded' fetches per worker
+    async_concurrency = 200
+    async_per_host = 4
+    http_pool_maxsize = 8
+    http_host_pool_sizes = None  # Host suffix -> pool size overrides
+    rate_limit_per_domain = 2.0  # Requests per second
+    rate_limit_burst = 4
+    domain_rate_limits = None  # Domain -> (rate, burst) overrides
+    max_page_mb = 5  # Career pages are cut off past this size
+    parser_mode = 'lxml'  # 'lxml' single-pass cascade, 'stream' incremental lxml without prefetch, else BeautifulSoup
+    
+    # Caches
+    http_cache_dir = 'http_cache'  # None disables conditional GETs
+    http_cache_max_entries = 20000
+    card_cache_path = 'card_cache.json'  # None disables the card cache
+    card_cache_ttl_hours = 72
+    card_cache_max_entries = 20000
+    known_url_index = True  # Skip URLs already stored in the jobs table
+    
+    # Browser tier
+    max_drivers = 3
+    driver_max_uses = 25
+    driver_max_memory_mb = 1024
+    browser_memory_mb = 500  # Free memory needed per browser worker
+    page_ready_timeout = 10  # Max seconds to wait for a Selenium page to render
+    page_ready_timeouts = None  # Per-company overrides, e.g. {'Meta': 20}
+    
+    # Strategy choice and host health
+    history_days = 7  # Window of scraping_logs used to pick strategies
+    http_retry_hours = 24  # How often Selenium companies get another HTTP try
+    failure_threshold = 3
+    base_backoff_minutes = 45
+    max_backoff_hours = 24
+    
+    # Background writer
+    write_batch_size = 100  # Jobs per insert
+    write_flush_seconds = 2.0  # Longest a job waits for its batch to fill
+    write_queue_size = 5000  # Scrapers block once this many jobs are waiting
+    write_retries = 3
+    write_copy_min_rows = 1000  # Backlog batches this large are loaded with COPY
+    
+    def __init__(self, **settings):
+        for name, value in settings.items():
+            if not hasattr(ScraperConfig, name):
+                raise TypeError(f"Unknown scraper setting: {name}")
+            setattr(self, name, value)
+
+class ImprovedJobScraper(JobPageParser):
+    """Improved job scraper with better detection and time filtering"""
+    
+    # Text, heading and link of every element matching arguments[0] (all links when null),
+    # collected in one WebDriver round trip instead of several per element
+    CARD_SCRIPT = """
+        var elements = arguments[0] ? document.querySelectorAll(arguments[0])
+                                    : document.getElementsByTagName('a');
+        var cards = [];
+        for (var i = 0; i < elements.length; i++) {
+            var element = elements[i];
+            var heading = element.querySelector('h1, h2, h3, h4, h5');
+            var link = element.tagName === 'A' ? element : element.querySelector('a');
+            cards.push({
+                text: (element.innerText || '').trim(),
+                title: heading ? (heading.innerText || '').trim() : null,
+                href: link ? link.href : null
+            });
+        }
+        return cards;
+    """
+    
+    def __init__(self, max_jobs_per_company=15, max_workers=8, timeout=8, max_days_old=7, config=None):
+        super().__init__(max_days_old=max_days_old)
+        config = config or ScraperConfig()
+        self.config = config
+        self.max_jobs_per_company = max_jobs_per_company
+        self.max_workers = max_workers  # HTTP/ATS tier size
+        self.browser_workers = self.get_browser_tier_size(config.max_drivers, config.browser_memory_mb)
+        self.timeout = timeout
+        self.fetch_mode = config.fetch_mode
+        self.page_ready_timeout = config.page_ready_timeout
+        self.page_ready_timeouts = config.page_ready_timeouts or {}
+        self.parser_mode = config.parser_mode
+        self.max_page_bytes = int(config.max_page_mb * 1024 * 1024)
+        self.history_days = config.history_days
+        self.http_retry_hours = config.http_retry_hours
+        
+        self.strategy_history = {}  # Refreshed from scraping_logs at the start of every cycle
+        self.unchanged_pages = set()  # URLs the HTTP cache reported as unchanged this cycle
+        self.cached_job_pages = set()  # URLs whose only valid jobs this cycle were already cached or stored
+        self.failed_fetches = set()  # (strategy, url) pairs whose fetch failed this cycle
+        self.extraction_stats = self.new_extraction_stats()  # Candidates per pipeline stage, this cycle
+        self._stats_lock = threading.Lock()
+        
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        }
+        
+        self.db = JobDatabase()
+        self.known_urls = KnownUrlIndex() if config.known_url_index else None
+        self.job_writer = JobWriter(
+            self.db,
+            batch_size=config.write_batch_size,
+            flush_seconds=config.write_flush_seconds,
+            max_queue=config.write_queue_size,
+            max_retries=config.write_retries,
+            copy_min_rows=config.write_copy_min_rows,
+            known_urls=self.known_urls
+        )
+        self.notifier = NotificationManager()
+        self.rate_limiter = DomainRateLimiter(
+            rate=config.rate_limit_per_domain,
+            burst=config.rate_limit_burst,
+            domain_limits=config.domain_rate_limits
+        )
+        self.http_sessions = HttpSessionPool(
+            headers=self.headers,
+            pool_maxsize=config.http_pool_maxsize,
+            host_pool_sizes=config.http_host_pool_sizes,
+            rate_limiter=self.rate_limiter
+        )
+        self.http_cache = HttpCache(
+            config.http_cache_dir, max_entries=config.http_cache_max_entries
+        ) if config.http_cache_dir else None
+        self.card_cache = CardCache(
+            config.card_cache_path, max_entries=config.card_cache_max_entries, ttl_hours=config.card_cache_ttl_hours
+        ) if config.card_cache_path else None
+        self.driver_pool = WebDriverPool(
+            max_size=self.browser_workers,
+            max_uses=config.driver_max_uses,
+            max_memory_mb=config.driver_max_memory_mb,
+            page_load_timeout=timeout
+        )
+        self.page_readiness = PageReadiness()
+        self.host_health = HostHealthTracker(
+            failure_threshold=config.failure_threshold,
+            base_backoff_minutes=config.base_backoff_minutes,
+            max_backoff_hours=config.max_backoff_hours
+        )
+        self.ats_client = AtsClient(self.http_sessions, timeout=timeout)
+        self.fetch_engine = AsyncFetchEngine(
+            timeout=timeout,
+            max_concurrency=config.async_concurrency,
+            per_host_limit=config.async_per_host,
+            headers=self.headers,
+            rate_limiter=self.rate_limiter,
+            max_bytes=self.max_page_bytes
+        )
+    
+    @staticmethod
+    def get_browser_tier_size(max_drivers, browser_memory_mb):
+        """Browser workers allowed by available memory and CPU, capped at max_drivers"""
+        available_mb = psutil.virtual_memory().available / (1024 * 1024)
+        by_memory = int(available_mb // browser_memory_mb)
+        by_cpu = max((os.cpu_count() or 2) // 2, 1)
+        return max(min(max_drivers, by_memory, by_cpu), 1)
+    
+    def host_allows(self, url):
+        """Ask the host's circuit breaker whether to fetch, sending the half-open probe if due"""
+        host = urlparse(url).netloc.lower()
+        verdict = self.host_health.check(host)
+        if verdict != 'probe':
+            return verdict == 'allow'
+        
+        # Cheap probe: HEAD with a short timeout; hosts that reject HEAD are still alive
+        try:
+            response = self.http_sessions.head(url, timeout=min(self.timeout, 3), allow_redirects=True)
+            if response.status_code < 400 or response.status_code in (405, 501):
+                self.host_health.record_success(host)
+                return True
+            self.host_health.record_failure(host, f"Probe returned {response.status_code}")
+        except Exception as e:
+            self.host_health.record_failure(host, f"Probe failed: {e}")
+        return False
+    
+    def record_fetch(self, url, status=None, error=None):
+        """Feed a fetch outcome into the host's circuit breaker"""
+        host = urlparse(url).netloc.lower()
+        if error or (status and status >= 400):
+            self.host_health.record_failure(host, error or f"HTTP {status}")
+        else:
+            self.host_health.record_success(host)
+    
+    def scrape_with_http(self, company_name, url, prefetched=None):
+        """Fast HTTP-based scraping with improved job detection
+        
+        When the async fetch engine already downloaded the page, its result is
+        passed in as ``prefetched`` and only parsing and extraction run here.
+        """
+        jobs = []
+        
+        try:
+            response = None
+            if prefetched is not None:
+                if prefetched['error']:
+                    logging.error(f"HTTP scraping failed for {company_name}: {prefetched['error']}")
+                    self.failed_fetches.add(('http', url))
+                    return []
+                status, response_headers, content = prefetched['status'], prefetched['headers'], prefetched['content']
+            else:
+                conditional_headers = self.http_cache.conditional_headers(url) if self.http_cache else {}
+                try:
+                    response = self.http_sessions.get(url, headers=conditional_headers, timeout=self.timeout,
+                                                      stream=True)
+                    response.raise_for_status()
+                except requests.RequestException as e:
+                    self.record_fetch(url, error=e)
+                    self.failed_fetches.add(('http', url))
+                    raise
+                self.record_fetch(url, status=response.status_code)
+                status, response_headers = response.status_code, response.headers
+                chunks = self.capped_chunks(response.iter_content(chunk_size=64 * 1024), url)
+                # Stream mode parses the body as it arrives instead of buffering it
+                content = None if self.parser_mode == 'stream' else b''.join(chunks)
+            
+            try:
+                # Unchanged pages were fully processed last cycle, so skip parsing and saving
+                if self.http_cache and self.http_cache.is_unchanged(url, status, content):
+                    logging.info(f"Career page unchanged for {company_name}, skipping extraction")
+                    self.unchanged_pages.add(url)
+                    return []
+                
+                if self.parser_mode == 'stream':
+                    if content is not None:
+                        chunks = (content[i:i + 64 * 1024] for i in range(0, len(content), 64 * 1024))
+                    job_elements = self.iter_job_elements_stream(chunks)
+                    read_candidate = self.read_candidate_lxml
+                    logging.info(f"Streaming potential job elements for {company_name}")
+                else:
+                    parse_start = time.perf_counter()
+                    if self.parser_mode == 'lxml':
+                        job_elements = self.find_job_elements_lxml(content)
+                        read_candidate = self.read_candidate_lxml
+                    else:
+                        job_elements = self.find_job_elements_soup(content)
+                        read_candidate = self.read_candidate_http
+                    logging.debug(f"Parsed {company_name} page ({len(content)} bytes) with {self.parser_mode} "
+                                  f"in {(time.perf_counter() - parse_start) * 1000:.0f}ms")
+                    logging.info(f"Processing {len(job_elements)} potential job elements for {company_name}")
+                
+                # Extract job data; in stream mode this stops reading once enough jobs are found
+                jobs = self.extract_jobs(job_elements, read_candidate, company_name, url)
+            finally:
+                if response is not None:
+                    response.close()
+            
+            if self.http_cache:
+                # Only pages that gave jobs may be skipped as unchanged; an empty page must be
+                # parsed again so an empty result can still escalate to Selenium
+                if jobs or url in self.cached_job_pages:
+                    self.http_cache.store(url, response_headers, content)
+                else:
+                    self.http_cache.invalidate(url)
+            
+            logging.info(f"Found {len(jobs)} valid jobs from {company_name} (HTTP)")
+            return jobs
+            
+        except Exception as e:
+            logging.error(f"HTTP scraping failed for {company_name}: {e}")
+            return []
+    
+    def capped_chunks(self, chunks, url):
+        """Pass chunks through until max_page_bytes, logging when a page gets truncated"""
+        total_bytes = 0
+        for chunk in chunks:
+            if total_bytes + len(chunk) > self.max_page_bytes:
+                yield chunk[:self.max_page_bytes - total_bytes]
+                logging.warning(f"Career page truncated at {self.max_page_bytes // 1024} KB: {url}")
+                return
+            total_bytes += len(chunk)
+            yield chunk
+    
+    def scrape_with_ats(self, company_name, url):
+        """Scrape an ATS-hosted career site through its JSON listing API"""
+        jobs = []
+        
+        try:
+            listings = self.ats_client.fetch_listings(url)
+            self.record_fetch(url)
+            logging.info(f"Processing {len(listings)} ATS listings for {company_name}")
+            
+            known = known_old = 0
+            for listing in listings:
+                # Recent stored jobs count toward the quota but skip extraction and the insert
+                if self.known_urls is not None and listing['url'] and listing['url'] in self.known_urls:
+                    if self.is_recent_posting(listing['title'], listing['raw_text'], listing['date_posted']):
+                        known += 1
+                        if len(jobs) + known >= self.max_jobs_per_company:
+                            break
+                    else:
+                        known_old += 1
+                    continue
+                
+                job_data = self.build_job_data(
+                    company_name, listing['title'], listing['url'], listing['raw_text'],
+                    location=listing['location'],
+                    date_posted=listing['date_posted'],
+                    employment_type=listing['employment_type']
+                )
+                if self.is_valid_job(job_data):
+                    jobs.append(job_data)
+                    if len(jobs) + known >= self.max_jobs_per_company:
+                        break
+            
+            logging.info(f"Found {len(jobs)} valid jobs from {company_name} "
+                         f"(ATS, {known} already stored, {known_old} stored but too old)")
+            if (known or known_old) and not jobs:
+                with self._stats_lock:
+                    self.cached_job_pages.add(url)
+            return jobs
+            
+        except Exception as e:
+            if isinstance(e, requests.RequestException):
+                self.record_fetch(url, error=e)
+            self.failed_fetches.add(('ats', url))
+            logging.error(f"ATS scraping failed for {company_name}: {e}")
+            return []
     
-    def get_scraping_strategy(self, company_name):
-        """Determine best scraping strategy for company"""
-        company_lower = company_name.lower()
+    def scrape_with_selenium(self, company_name, url):
+        """Selenium-based scraping with improved detection"""
+        try:
+            with self.driver_pool.lease() as driver:
+                return self._scrape_with_driver(driver, company_name, url)
+        except Exception as e:
+            logging.error(f"Selenium scraping failed for {company_name}: {e}")
+            return []
+    
+    def _scrape_with_driver(self, driver, company_name, url):
+        """Scrape one company's career page with a leased driver"""
+        jobs = []
         
-        # Companies that work better with Selenium
-        selenium_companies = [
-            'meta', 'facebook', 'google', 'alphabet', 'netflix', 'airbnb',
-            'uber', 'lyft', 'stripe', 'figma', 'databricks'
+        max_wait = self.page_ready_timeouts.get(company_name, self.page_ready_timeout)
+        strong_selectors = [
+            selector for selector in self.selenium_job_selectors
+            if selector not in self.generic_job_selectors
         ]
         
-        for selenium_company in selenium_companies:
-            if selenium_company in company_lower:
+        self.rate_limiter.acquire(url)
+        driver.get(url)
+        readiness = self.page_readiness.wait(driver, self.selenium_job_selectors, max_wait, strong_selectors)
+        
+        # Scroll to load lazy content, unless enough job cards already rendered
+        if readiness['matches'] < self.max_jobs_per_company:
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            remaining_wait = max(max_wait - readiness['seconds'], 0)
+            # Lazy loading only shows up as DOM growth, so wait for it to settle
+            after_scroll = self.page_readiness.wait(
+                driver, self.selenium_job_selectors, min(remaining_wait, 2), strong_selectors=[]
+            )
+            readiness['seconds'] += after_scroll['seconds']
+            readiness['selector'] = after_scroll['selector'] or readiness['selector']
+        
+        logging.info(f"Page ready for {company_name} in {readiness['seconds']:.2f}s "
+                     f"({readiness['reason']}, selector: {readiness['selector']})")
+        
+        # The readiness probe already found the first matching selector; read every card in one call
+        job_cards = []
+        if readiness['selector']:
+            job_cards = driver.execute_script(self.CARD_SCRIPT, readiness['selector']) or []
+            logging.debug(f"Found {len(job_cards)} elements with selector: {readiness['selector']}")
+        
+        # Fallback: find all links and filter
+        if not job_cards:
+            all_links = driver.execute_script(self.CARD_SCRIPT, None) or []
+            job_cards = [
+                link for link in all_links
+                if (any(keyword in (link['href'] or '').lower() for keyword in ['/job', '/career']) or
+                    self.keyword_matcher.has(link['text'], 'tech'))
+            ]
+        
+        logging.info(f"Processing {len(job_cards)} potential job elements for {company_name}")
+        
+        # Extract job data
+        jobs = self.extract_jobs(job_cards, self.read_candidate_selenium, company_name, url)
+        
+        logging.info(f"Found {len(jobs)} valid jobs from {company_name} (Selenium)")
+        return jobs
+    
+    @staticmethod
+    def new_extraction_stats():
+        """Zeroed counters for extract_jobs"""
+        return {
+            'candidates': 0, 'unreadable': 0, 'no_title': 0, 'no_url': 0, 'duplicate_url': 0, 'known_url': 0,
+            'known_old': 0, 'senior_title': 0, 'not_tech': 0, 'cached_valid': 0, 'cached_invalid': 0,
+            'extracted': 0, 'invalid': 0, 'accepted': 0
+        }
+    
+    def prefilter_candidate(self, title, url, raw_text, seen_urls):
+        """Cheap checks on title and URL alone; returns the rejection stage or None
+        
+        Mirrors the parts of is_valid_job that do not need the extracted
+        fields, so junk elements never pay for date, salary and location
+        extraction.
+        """
+        if not title or len(title) < 5:
+            return 'no_title'
+        if not url:
+            return 'no_url'
+        if url in seen_urls:
+            return 'duplicate_url'
+        if self.known_urls is not None and url in self.known_urls:
+            # Stored jobs were valid when saved; only recent ones may count toward the quota
+            return 'known_url' if self.is_recent_posting(title, raw_text) else 'known_old'
+        
+        title_classes = self.keyword_matcher.classes(title)
+        if 'senior' in title_classes:
+            return 'senior_title'
+        if 'tech' not in title_classes and not self.keyword_matcher.has(raw_text[:500], 'tech'):
+            return 'not_tech'
+        return None
+    
+    def extract_jobs(self, elements, read_candidate, company_name, base_url):
+        """Staged extraction: read title and URL, prefilter, skip cached cards, then validate the survivors"""
+        jobs = []
+        stats = self.new_extraction_stats()
+        
+        for survivor in self.iter_survivors(elements, read_candidate, base_url, stats):
+            stats['extracted'] += 1
+            job_data = self.validate_candidate(survivor, company_name)
+            card_key = survivor[3]
+            if card_key:
+                self.card_cache.put(card_key, job_data is not None, job_data)
+            if job_data is None:
+                stats['invalid'] += 1
+                continue
+            
+            stats['accepted'] += 1
+            jobs.append(job_data)
+            if len(jobs) + stats['cached_valid'] + stats['known_url'] >= self.max_jobs_per_company:
+                break
+        
+        logging.debug(f"Extraction stages for {company_name}: {stats}")
+        with self._stats_lock:
+            for stage, count in stats.items():
+                self.extraction_stats[stage] += count
+            if (stats['cached_valid'] or stats['known_url'] or stats['known_old']) and not jobs:
+                self.cached_job_pages.add(base_url)
+        return jobs
+    
+    def iter_survivors(self, elements, read_candidate, base_url, stats):
+        """Yield (title, url, raw_text, card_key) for candidates that pass the prefilter and are not cached"""
+        seen_urls = set()
+        for element in elements:
+            # Cached valid cards and recent stored jobs count toward the quota like freshly accepted ones
+            if stats['accepted'] + stats['cached_valid'] + stats['known_url'] >= self.max_jobs_per_company:
+                return
+            
+            stats['candidates'] += 1
+            candidate = read_candidate(element, base_url)
+            if candidate is None:
+                stats['unreadable'] += 1
+                continue
+            
+            title, url, raw_text = candidate
+            rejection = self.prefilter_candidate(title, url, raw_text, seen_urls)
+            if rejection:
+                stats[rejection] += 1
+                continue
+            seen_urls.add(url)
+            
+            # Cards unchanged since an earlier cycle were already validated and saved
+            card_key = None
+            if self.card_cache:
+                card_key = CardCache.card_key(title, url, raw_text)
+                entry = self.card_cache.get(card_key)
+                if entry is not None:
+                    stats['cached_valid' if entry['valid'] else 'cached_invalid'] += 1
+                    continue
+            
+            yield title, url, raw_text, card_key
+    
+    def validate_candidate(self, survivor, company_name):
+        """Full extraction and validation of one survivor; the JobRecord, or None if invalid"""
+        title, url, raw_text, _ = survivor
+        try:
+            job_data = self.build_job_data(company_name, title, url, raw_text)
+            return job_data if self.is_valid_job(job_data) else None
+        except Exception as e:
+            logging.debug(f"Error extracting job data: {e}")
+            return None
+    
+    def log_extraction_stats(self):
+        """Log this cycle's per-stage rejection counts and reset them"""
+        with self._stats_lock:
+            stats, self.extraction_stats = self.extraction_stats, self.new_extraction_stats()
+        
+        rejected_early = stats['candidates'] - stats['extracted']
+        logging.info(f"Extraction pipeline: {stats['candidates']} candidates, {rejected_early} skipped before "
+                     f"extraction (unreadable {stats['unreadable']}, no title {stats['no_title']}, "
+                     f"no URL {stats['no_url']}, duplicate URL {stats['duplicate_url']}, "
+                     f"already stored {stats['known_url']}, stored but too old {stats['known_old']}, "
+                     f"senior title {stats['senior_title']}, not tech {stats['not_tech']}, "
+                     f"cached {stats['cached_valid'] + stats['cached_invalid']}), "
+                     f"{stats['extracted']} fully extracted, {stats['invalid']} invalid, {stats['accepted']} accepted")
+    
+    def get_scraping_strategy(self, company_name, url=None):
+        """Pick the cheapest strategy that produced jobs recently for this company
+        
+        Costs go ats < http < selenium. Known ATS sites start on their JSON
+        API; one that recently found nothing is skipped for
+        ``http_retry_hours`` and the company is handled like any other.
+        Companies without a productive history start on HTTP and are
+        escalated to Selenium by scrape_company only when HTTP finds nothing.
+        Selenium companies get another HTTP try every ``http_retry_hours`` in
+        case the page no longer needs a browser.
+        """
+        history = self.strategy_history.get(company_name, {})
+        ats_history = history.get('ats')
+        http_history = history.get('http')
+        selenium_history = history.get('selenium')
+        
+        # Known ATS sites have a JSON API that beats both HTML and Selenium
+        if url and self.ats_client.detect(url):
+            if not ats_history or ats_history['jobs_found'] > 0:
+                return 'ats'
+            hours_since_ats = (datetime.now() - ats_history['last_attempt']).total_seconds() / 3600
+            if hours_since_ats >= self.http_retry_hours:
+                return 'ats'
+        
+        if http_history and http_history['jobs_found'] > 0:
+            return 'http'
+        
+        if selenium_history and selenium_history['jobs_found'] > 0 and http_history:
+            hours_since_http = (datetime.now() - http_history['last_attempt']).total_seconds() / 3600
+            if hours_since_http < self.http_retry_hours:
                 return 'selenium'
         
         return 'http'  # Default to faster HTTP
     
-    def scrape_company(self, company_data):
-        """Scrape a single company using optimal strategy"""
+    def should_escalate(self, company_name):
+        """Escalate an empty HTTP result to Selenium unless Selenium recently found nothing either"""
+        selenium_history = self.strategy_history.get(company_name, {}).get('selenium')
+        if not selenium_history or selenium_history['jobs_found'] > 0:
+            return True
+        
+        hours_since_selenium = (datetime.now() - selenium_history['last_attempt']).total_seconds() / 3600
+        return hours_since_selenium >= self.http_retry_hours
+    
+    def run_strategy(self, strategy, company_name, url, prefetched=None):
+        """Run one scraping strategy and describe the attempt for scraping_logs"""
+        start_time = time.time()
+        
+        if strategy == 'ats':
+            jobs = self.scrape_with_ats(company_name, url)
+        elif strategy == 'selenium':
+            jobs = self.scrape_with_selenium(company_name, url)
+        else:
+            jobs = self.scrape_with_http(company_name, url, prefetched)
+        
+        if url in self.unchanged_pages or url in self.cached_job_pages:
+            status = 'unchanged'
+        elif (strategy, url) in self.failed_fetches:
+            # A page that could not be fetched says nothing about whether the strategy works for it
+            status = 'error'
+        else:
+            status = 'success' if jobs else 'no_jobs'
+        
+        return jobs, {
+            'company_name': company_name,
+            'website_url': url,
+            'strategy': strategy,
+            'jobs_found': len(jobs),
+            'entry_level_found': sum(1 for job in jobs if job['experience_required'] == 'Entry Level'),
+            'status': status,
+            'duration_seconds': time.time() - start_time
+        }
+    
+    def scrape_company(self, company_data, prefetched=None, strategy=None):
+        """Scrape a single company using optimal strategy
+        
+        An ATS attempt that fails or finds nothing falls back to HTTP on the
+        career page. An HTTP attempt that finds nothing comes back with
+        ``escalate`` set so the cycle can queue the company on the browser tier.
+        """
         company_name = company_data['company']
         url = company_data['website']
         
-        strategy = self.get_scraping_strategy(company_name)
+        strategy = strategy or self.get_scraping_strategy(company_name, url)
+        
+        # Prefetched pages already went through the breaker; Selenium pages are held back by
+        # an open circuit too, although only HTTP and ATS fetches feed it
+        if prefetched is None and not self.host_allows(url):
+            logging.info(f"Skipping {company_name}: circuit open for {urlparse(url).netloc}")
+            return {
+                'company': company_name,
+                'jobs': [],
+                'success': True,
+                'strategy': strategy,
+                'escalate': False,
+                'attempts': [{
+                    'company_name': company_name,
+                    'website_url': url,
+                    'strategy': strategy,
+                    'jobs_found': 0,
+                    'entry_level_found': 0,
+                    'status': 'circuit_open',
+                    'duration_seconds': 0.0
+                }]
+            }
         
         try:
             logging.info(f"Scraping {company_name} using {strategy} strategy")
             
-            if strategy == 'selenium':
-                jobs = self.scrape_with_selenium(company_name, url)
-            else:
-                jobs = self.scrape_with_http(company_name, url)
+            jobs, attempt = self.run_strategy(strategy, company_name, url, prefetched)
+            attempts = [attempt]
+            
+            if strategy == 'ats' and attempt['status'] in ('no_jobs', 'error'):
+                logging.info(f"ATS found no jobs for {company_name}, trying HTTP")
+                strategy = 'http'
+                jobs, attempt = self.run_strategy(strategy, company_name, url)
+                attempts.append(attempt)
             
             return {
                 'company': company_name,
                 'jobs': jobs,
                 'success': True,
-                'strategy': strategy
+                'strategy': strategy,
+                'attempts': attempts,
+                'escalate': (strategy == 'http' and attempt['status'] == 'no_jobs'
+                             and self.should_escalate(company_name) and self.host_allows(url))
             }
             
         except Exception as e:
@@ -927,9 +3183,27 @@ class ImprovedJobScraper:
                 'jobs': [],
                 'success': False,
                 'error': str(e),
-                'strategy': strategy
+                'strategy': strategy,
+                'escalate': False,
+                'attempts': [{
+                    'company_name': company_name,
+                    'website_url': url,
+                    'strategy': strategy,
+                    'jobs_found': 0,
+                    'entry_level_found': 0,
+                    'status': 'error',
+                    'error_message': str(e),
+                    'duration_seconds': 0.0
+                }]
             }
     
+    def scrape_and_submit(self, company_data, prefetched=None, strategy=None):
+        """Scrape a company and hand its jobs to the writer from the worker thread"""
+        result = self.scrape_company(company_data, prefetched, strategy)
+        if result['success'] and result['jobs']:
+            self.job_writer.submit(result['jobs'])
+        return result
+    
     def run_scraping_cycle(self, companies_file='companies_list.csv'):
         """Run one complete scraping cycle"""
         start_time = time.time()
@@ -942,29 +3216,91 @@ class ImprovedJobScraper:
             logging.info(f"Starting improved scraping cycle for {len(companies)} companies")
             logging.info(f"Configuration: max_jobs={self.max_jobs_per_company}, max_days_old={self.max_days_old}")
             
-            all_jobs = []
+            total_jobs = 0
+            attempts = []
+            self.strategy_history = self.db.get_strategy_history(self.history_days)
+            self.host_health.load(self.db.load_host_health())
+            self.unchanged_pages = set()
+            self.cached_job_pages = set()
+            self.failed_fetches = set()
+            if self.known_urls is not None and not self.known_urls.loaded:
+                self.known_urls.load(self.db.load_job_url_hashes())
+            
+            strategies = {
+                company['company']: self.get_scraping_strategy(company['company'], company['website'])
+                for company in companies
+            }
             
-            # Parallel processing
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_company = {
-                    executor.submit(self.scrape_company, company): company['company']
-                    for company in companies
-                }
+            # Download all HTTP-strategy pages up front on one event loop so
+            # worker threads only spend their time parsing and extracting
+            # Stream parsing reads pages itself so it can stop early, so it skips the prefetch
+            prefetched = {}
+            if self.fetch_mode == 'async' and self.parser_mode != 'stream':
+                http_urls = [
+                    company['website'] for company in companies
+                    if strategies[company['company']] == 'http' and self.host_allows(company['website'])
+                ]
+                request_headers = {}
+                if self.http_cache:
+                    request_headers = {url: self.http_cache.conditional_headers(url) for url in http_urls}
+                prefetched = self.fetch_engine.fetch_all(http_urls, request_headers)
+                for url, result in prefetched.items():
+                    self.record_fetch(url, status=result['status'], error=result['error'])
+            
+            # HTTP/ATS and browser work run on separate pools so slow Chrome
+            # pages never hold the slots cheap HTTP companies need
+            executor = TieredExecutor({'http': self.max_workers, 'browser': self.browser_workers})
+            try:
+                pending = {}
+                for company in companies:
+                    strategy = strategies[company['company']]
+                    tier = 'browser' if strategy == 'selenium' else 'http'
+                    # Handing the page over leaves the task its only holder, so each
+                    # body is freed once its company is done instead of at cycle end
+                    future = executor.submit(tier, self.scrape_and_submit, company,
+                                             prefetched.pop(company['website'], None), strategy)
+                    pending[future] = company
                 
-                for future in as_completed(future_to_company):
-                    company_name = future_to_company[future]
-                    try:
-                        result = future.result()
-                        if result['success']:
-                            all_jobs.extend(result['jobs'])
-                            logging.info(f"✓ {company_name} ({result['strategy']}): {len(result['jobs'])} jobs")
-                        else:
-                            logging.warning(f"✗ {company_name}: Failed")
-                    except Exception as e:
-                        logging.error(f"✗ {company_name}: {e}")
-            
-            # Save jobs to database
-            saved_count = self.db.bulk_save_jobs(all_jobs)
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        company = pending.pop(future)
+                        company_name = company['company']
+                        try:
+                            result = future.result()
+                            attempts.extend(result['attempts'])
+                            if result['escalate']:
+                                logging.info(f"↗ {company_name}: HTTP found no jobs, queued on browser tier")
+                                future = executor.submit('browser', self.scrape_and_submit, company, None, 'selenium')
+                                pending[future] = company
+                            elif result['success']:
+                                total_jobs += len(result['jobs'])
+                                logging.info(f"✓ {company_name} ({result['strategy']}): {len(result['jobs'])} jobs")
+                            else:
+                                logging.warning(f"✗ {company_name}: Failed")
+                        except Exception as e:
+                            logging.error(f"✗ {company_name}: {e}")
+            finally:
+                executor.shutdown()
+            
+            executor.log_metrics()
+            
+            # Jobs were saved while companies finished; wait for the last batches
+            self.job_writer.flush()
+            saved_count = self.job_writer.stats['inserted']
+            failed_companies = self.job_writer.take_failed_companies()
+            if self.card_cache:
+                # Only remember valid cards once their jobs are safely stored
+                if failed_companies:
+                    self.card_cache.discard_pending()
+                else:
+                    self.card_cache.commit_pending()
+            if self.http_cache:
+                # Pages whose jobs were lost must not come back as unchanged next cycle
+                for company in companies:
+                    if company['company'] in failed_companies:
+                        self.http_cache.invalidate(company['website'])
+            self.db.log_scrape_attempts(attempts)
             
             # Send notifications for new jobs
             if saved_count > 0:
@@ -980,15 +3316,30 @@ class ImprovedJobScraper:
             
             elapsed_time = time.time() - start_time
             
+            self.http_sessions.log_stats()
+            self.rate_limiter.log_stats()
+            self.log_extraction_stats()
+            self.job_writer.log_stats()
+            if self.known_urls is not None:
+                self.known_urls.log_stats()
+            self.db.save_host_health(self.host_health.changed_hosts())
+            self.db.pool.log_stats()
+            logging.info(f"Chrome driver pool: {self.driver_pool.stats['created']} created, "
+                         f"{self.driver_pool.stats['leased']} leases, {self.driver_pool.stats['recycled']} recycled")
+            if self.http_cache:
+                self.http_cache.save()
+            if self.card_cache:
+                self.card_cache.save()
+            
             logging.info(f"""
             ========================================
             IMPROVED SCRAPING CYCLE COMPLETED
             ========================================
             Companies processed: {len(companies)}
-            Total jobs found: {len(all_jobs)}
+            Total jobs found: {total_jobs}
             New jobs saved: {saved_count}
             Time elapsed: {elapsed_time:.1f} seconds ({elapsed_time/60:.1f} minutes)
-            Jobs per company (avg): {len(all_jobs)/len(companies):.1f}
+            Jobs per company (avg): {total_jobs/len(companies):.1f}
             Recent jobs only: Last {self.max_days_old} days
             Notifications sent: {'Yes' if saved_count > 0 else 'No'}
             """)
@@ -1003,9 +3354,10 @@ def run_hourly_scheduler():
     """Run the improved scraper every hour"""
     scraper = ImprovedJobScraper(
         max_jobs_per_company=20,  # Increased to get more jobs
-        max_workers=8,
+        max_workers=8,  # HTTP tier; the browser tier is sized from free memory and CPU
         timeout=8,
-        max_days_old=7  # Only jobs from last 7 days
+        max_days_old=7,  # Only jobs from last 7 days
+        config=ScraperConfig(fetch_mode='async')  # Fetch HTTP career pages concurrently on one event loop
     )
     
     def scheduled_job():
@@ -1034,6 +3386,7 @@ def run_hourly_scheduler():
             schedule.run_pending()
             time.sleep(60)
     except KeyboardInterrupt:
+        scraper.driver_pool.close()
         logging.info("Improved scraper stopped by user")
 
 def main():
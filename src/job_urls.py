@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Canonical job URLs and the 64-bit key that identifies a job in the database
+"""
+
+import hashlib
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from psycopg2.extras import execute_values
+
+# Query parameters that only say how a visitor reached the posting. Generic names like
+# 'ref' or 'source' are left alone, since some job boards use them to pick the posting.
+TRACKING_PARAMS = {
+    'gclid', 'dclid', 'fbclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid', '_ga', '_gl',
+    'gh_src', 'lever-source', 'lever-origin'
+}
+TRACKING_PREFIXES = ('utm_',)
+
+# Tracking parameters only stripped on these hosts and their subdomains
+HOST_TRACKING_PARAMS = {
+    'linkedin.com': {'trk', 'trackingid', 'refid'},
+}
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# SQL twin of url_hash, used for the generated jobs.url_hash column
+URL_HASH_SQL = "('x' || substr(md5(job_url), 1, 16))::bit(64)::bigint"
+
+def canonicalize_url(url, base_url=None):
+    """Resolve a job link against its page and reduce it to one canonical form
+    
+    Scheme and host are lower-cased, default ports, fragments, trailing
+    slashes and tracking parameters are dropped, and the remaining query
+    parameters are sorted. The path keeps its case, since many job boards
+    use case-sensitive IDs. Links that are not http(s) come back unchanged.
+    """
+    url = (url or '').strip()
+    if base_url:
+        url = urljoin(base_url, url)
+    
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return url
+    
+    host = parts.hostname
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+    
+    tracking = TRACKING_PARAMS.union(*(
+        params for suffix, params in HOST_TRACKING_PARAMS.items()
+        if parts.hostname == suffix or parts.hostname.endswith('.' + suffix)
+    ))
+    path = parts.path.rstrip('/') or '/'
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in tracking and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+def url_hash(url):
+    """Signed 64-bit key of a job URL: the first 8 bytes of its MD5, as URL_HASH_SQL computes it"""
+    return int.from_bytes(hashlib.md5(url.encode('utf-8')).digest()[:8], 'big', signed=True)
+
+def migrate_job_urls(cursor):
+    """Canonicalize stored job URLs and key jobs by url_hash instead of the URL text
+    
+    Rows whose URLs collapse to the same canonical URL are duplicates; the
+    oldest one is kept.
+    """
+    cursor.execute(f"""
+        ALTER TABLE jobs ADD COLUMN IF NOT EXISTS url_hash BIGINT
+            GENERATED ALWAYS AS ({URL_HASH_SQL}) STORED
+    """)
+    
+    cursor.execute("SELECT id, job_url FROM jobs ORDER BY id")
+    keepers = {}
+    duplicates = []
+    updates = []
+    for job_id, job_url in cursor.fetchall():
+        canonical = canonicalize_url(job_url)[:1000]
+        if canonical in keepers:
+            duplicates.append(job_id)
+        else:
+            keepers[canonical] = job_id
+            if canonical != job_url:
+                updates.append((job_id, canonical))
+    
+    # Duplicates go first so no update collides with a row that is about to disappear
+    if duplicates:
+        cursor.execute("DELETE FROM jobs WHERE id = ANY(%s)", (duplicates,))
+    if updates:
+        execute_values(cursor, """
+            UPDATE jobs SET job_url = v.job_url
+            FROM (VALUES %s) AS v(id, job_url)
+            WHERE jobs.id = v.id
+        """, updates, page_size=1000)
+    
+    cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_url_hash ON jobs(url_hash);
+        ALTER TABLE jobs DROP CONSTRAINT IF EXISTS jobs_job_url_key;
+        DROP INDEX IF EXISTS idx_jobs_url;
+    """)
+    
+    cursor.execute(f"""
+        ALTER TABLE IF EXISTS jobs_staging ADD COLUMN IF NOT EXISTS url_hash BIGINT
+            GENERATED ALWAYS AS ({URL_HASH_SQL}) STORED
+    """)
+    return len(updates), len(duplicates)
+
+def ensure_url_hash_key(cursor):
+    """Key jobs by url_hash, running migrate_job_urls first if the key is not in place yet
+    
+    The unique index on url_hash only makes sense once every stored URL is
+    canonical, so the swap never happens without the row migration. Returns
+    the migration's (canonicalized, removed) counts, or None if the key was
+    already there.
+    """
+    cursor.execute("SELECT to_regclass('idx_jobs_url_hash') IS NOT NULL")
+    if cursor.fetchone()[0]:
+        return None
+    
+    # Rewriting every stored URL can outlast the pool's statement_timeout
+    cursor.execute("SET LOCAL statement_timeout = 0")
+    return migrate_job_urls(cursor)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Outbox of jobs waiting for a notification, filled by a trigger on jobs
+"""
+
+OUTBOX_SQL = """
+    CREATE TABLE IF NOT EXISTS notification_outbox (
+        job_id INTEGER PRIMARY KEY REFERENCES jobs(id) ON DELETE CASCADE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        claimed_until TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_notification_outbox_created ON notification_outbox(created_at);
+    
+    CREATE OR REPLACE FUNCTION enqueue_job_notifications() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO notification_outbox (job_id, created_at)
+        SELECT id, created_at FROM new_jobs
+        ON CONFLICT DO NOTHING;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    
+    DROP TRIGGER IF EXISTS jobs_enqueue_notifications ON jobs;
+    CREATE TRIGGER jobs_enqueue_notifications
+        AFTER INSERT ON jobs
+        REFERENCING NEW TABLE AS new_jobs
+        FOR EACH STATEMENT EXECUTE FUNCTION enqueue_job_notifications();
+    
+    DROP INDEX IF EXISTS idx_jobs_notification;
+"""
+
+def ensure_notification_outbox(cursor, backfill=False):
+    """Create the outbox and its trigger, queueing jobs still flagged unsent when the outbox is new
+    
+    ``backfill=True`` queues them even if the outbox already existed.
+    Returns the number of jobs queued.
+    """
+    cursor.execute("SELECT to_regclass('notification_outbox') IS NULL")
+    created = cursor.fetchone()[0]
+    cursor.execute(OUTBOX_SQL)
+    
+    if not (created or backfill):
+        return 0
+    cursor.execute("""
+        INSERT INTO notification_outbox (job_id, created_at)
+        SELECT id, created_at FROM jobs WHERE notification_sent = FALSE
+        ON CONFLICT DO NOTHING
+    """)
+    return cursor.rowcount
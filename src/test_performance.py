@@ -98,7 +98,9 @@ def test_database_connection():
         }
         
         saved = scraper.db.bulk_save_jobs([dummy_job])
-        if saved > 0:
+        if saved is None:
+            print("❌ Database write failed")
+        elif saved > 0:
             print("✅ Database write successful")
         else:
             print("✅ Database write successful (job already exists)")
@@ -1,52 +1,75 @@
 #!/usr/bin/env python3
 
-import psycopg2
-import os
 from dotenv import load_dotenv
+from db_pool import get_pool
+from job_urls import migrate_job_urls
+from notification_outbox import ensure_notification_outbox
 
 # Load environment variables
 load_dotenv()
 
+def add_columns(cursor):
+    """Add columns introduced after the first schema"""
+    cursor.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS date_posted VARCHAR(100);")
+    cursor.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS raw_text TEXT;")
+    cursor.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS email_sent BOOLEAN DEFAULT FALSE;")
+    return "Added date_posted, raw_text and email_sent columns"
+
+def add_strategy_tracking(cursor):
+    """Record the strategy behind every scraping run and a company's preferred one"""
+    cursor.execute("ALTER TABLE IF EXISTS scraping_logs ADD COLUMN IF NOT EXISTS strategy VARCHAR(20);")
+    cursor.execute("ALTER TABLE IF EXISTS scraping_logs ALTER COLUMN duration_seconds TYPE REAL;")
+    cursor.execute("ALTER TABLE IF EXISTS companies ADD COLUMN IF NOT EXISTS preferred_strategy VARCHAR(20);")
+    return "Added strategy tracking to scraping_logs and companies"
+
+def key_jobs_by_url_hash(cursor):
+    """Canonicalize stored job URLs and move the unique key to url_hash"""
+    canonicalized, removed = migrate_job_urls(cursor)
+    return f"Keyed jobs by url_hash ({canonicalized} URLs canonicalized, {removed} duplicates removed)"
+
+def add_notification_outbox(cursor):
+    """Queue unsent jobs in notification_outbox"""
+    # Always backfill: an outbox created by an older scraper start may be missing unsent jobs
+    queued = ensure_notification_outbox(cursor, backfill=True)
+    return f"Added notification_outbox ({queued} unsent jobs queued)"
+
+MIGRATION_STEPS = [add_columns, add_strategy_tracking, key_jobs_by_url_hash, add_notification_outbox]
+
 def update_database_schema():
-    """Update database schema to add new columns"""
+    """Update database schema to add new columns
+    
+    All steps run in one transaction, each behind its own savepoint, so a
+    failed step is rolled back on its own and the later steps still run.
+    The steps that succeeded are committed; a rerun repeats the failed ones.
+    """
     try:
-        # Connect to database
-        conn = psycopg2.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            database=os.getenv('DB_NAME', 'job_scraper'),
-            user=os.getenv('DB_USER', 'postgres'),
-            password=os.getenv('DB_PASSWORD', ''),
-            port=os.getenv('DB_PORT', '5432')
-        )
-        
-        cursor = conn.cursor()
-        
-        # Add new columns if they don't exist
-        try:
-            cursor.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS date_posted VARCHAR(100);")
-            print("✅ Added date_posted column")
-        except Exception as e:
-            print(f"date_posted column: {e}")
-        
-        try:
-            cursor.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS raw_text TEXT;")
-            print("✅ Added raw_text column")
-        except Exception as e:
-            print(f"raw_text column: {e}")
-        
-        try:
-            cursor.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS email_sent BOOLEAN DEFAULT FALSE;")
-            print("✅ Added email_sent column")
-        except Exception as e:
-            print(f"email_sent column: {e}")
-        
-        # Commit changes
-        conn.commit()
-        cursor.close()
-        conn.close()
-        
-        print("✅ Database schema updated successfully!")
-        return True
+        with get_pool().connection() as conn:
+            cursor = conn.cursor()
+            
+            # Rewriting every job row can take far longer than the pool's statement_timeout
+            cursor.execute("SET LOCAL statement_timeout = 0")
+            
+            failed = []
+            for step in MIGRATION_STEPS:
+                cursor.execute("SAVEPOINT migration_step")
+                try:
+                    print(f"✅ {step(cursor)}")
+                    cursor.execute("RELEASE SAVEPOINT migration_step")
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO SAVEPOINT migration_step")
+                    print(f"❌ {step.__name__} failed: {e}")
+                    failed.append(step.__name__)
+            
+            # Commit changes
+            conn.commit()
+            cursor.close()
+            
+            if failed:
+                print(f"❌ {len(failed)} migration step(s) failed: {', '.join(failed)}")
+                return False
+            
+            print("✅ Database schema updated successfully!")
+            return True
         
     except Exception as e:
         print(f"❌ Error updating database schema: {e}")
@@ -60,4 +83,4 @@ if __name__ == "__main__":
         print("\n🎉 Database is ready for the improved scraper!")
         print("You can now run: python3 improved_hourly_scraper.py")
     else:
-        print("\n❌ Database update failed. Please check your database connection.") 
\ No newline at end of file
+        print("\n❌ Database update failed. Please check the errors above and your database connection.") 
\ No newline at end of file